@@ -0,0 +1,26 @@
+"""
+SecureString.generate_many compared to wrapping `secrets.token_urlsafe` per token
+
+python benchmarks/bench_generate.py
+"""
+import secrets
+import timeit
+from secure_string import SecureString
+
+NUMBER: int = 10
+TOKENS: int = 100_000
+
+
+def bench(title: str, func) -> None:
+    seconds: float = timeit.timeit(func, number=NUMBER)
+    print(f'{title:<40} {seconds / NUMBER / TOKENS * 1e9:>10.0f} ns per token')
+
+
+def main() -> None:
+    bench('SecureString(token_urlsafe(32))', lambda: [SecureString(secrets.token_urlsafe(32)) for _ in range(TOKENS)])
+    bench('generate_many(nbytes=32)', lambda: list(SecureString.generate_many(TOKENS)))
+    bench('generate_many(nbytes=4, digits)', lambda: list(SecureString.generate_many(TOKENS, 4, '0123456789')))
+
+
+if __name__ == '__main__':
+    main()
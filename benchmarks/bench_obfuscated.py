@@ -0,0 +1,29 @@
+"""
+The cost of `.value` of SecureStringObfuscated with and without the plaintext LRU cache
+
+python benchmarks/bench_obfuscated.py
+"""
+import timeit
+from secure_string import SecureString, SecureStringObfuscated
+
+NUMBER: int = 100_000
+
+
+def bench(title: str, ss: SecureString) -> None:
+    seconds: float = timeit.timeit(lambda: ss.value, number=NUMBER)
+    print(f'{title:<40} {seconds / NUMBER * 1e9:>10.0f} ns per .value')
+
+
+def main() -> None:
+    value: str = 'my password' * 10
+    bench('SecureString', SecureString(value))
+
+    SecureStringObfuscated._cache_size = 128
+    bench('SecureStringObfuscated, LRU', SecureStringObfuscated(value))
+
+    SecureStringObfuscated._cache_size = 0
+    bench('SecureStringObfuscated, no LRU', SecureStringObfuscated(value))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,28 @@
+"""
+SecureString operations in SecureStringContextManager(False) and in the passthrough scope compared to str
+
+python benchmarks/bench_passthrough.py
+"""
+import timeit
+from secure_string import SecureString, SecureStringContextManager, passthrough
+
+NUMBER: int = 100_000
+
+
+def bench(title: str, value: str) -> None:
+    seconds: float = timeit.timeit(lambda: (value.upper(), value == 'x', len(value), f'{value}'), number=NUMBER)
+    print(f'{title:<40} {seconds / NUMBER * 1e9:>10.0f} ns per 4 operations')
+
+
+def main() -> None:
+    bench('str', 'my password')
+
+    with SecureStringContextManager(False):
+        bench('SecureString, unprotected', SecureString('my password'))
+
+    with passthrough():
+        bench('SecureString, passthrough', SecureString('my password'))
+
+
+if __name__ == '__main__':
+    main()
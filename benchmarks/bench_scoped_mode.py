@@ -0,0 +1,45 @@
+"""
+Per-call cost of switching the mode by `with SecureStringContextManager(False)` and by `@unprotected`
+at nesting depths from 1 to 100
+
+python benchmarks/bench_scoped_mode.py
+"""
+import timeit
+from typing import Callable
+from secure_string import SecureStringContextManager, unprotected
+
+NUMBER: int = 1_000
+DEPTHS = (1, 10, 100)
+
+
+def with_context_manager(depth: int) -> None:
+    with SecureStringContextManager(False):
+        if depth > 1:
+            with_context_manager(depth - 1)
+
+
+@unprotected
+def with_decorator(depth: int) -> None:
+    if depth > 1:
+        with_decorator(depth - 1)
+
+
+def plain(depth: int) -> None:
+    if depth > 1:
+        plain(depth - 1)
+
+
+def bench(title: str, func: Callable[[int], None], depth: int) -> None:
+    seconds: float = timeit.timeit(lambda: func(depth), number=NUMBER)
+    print(f'{title:<40} depth {depth:>3} {seconds / NUMBER / depth * 1e9:>10.0f} ns per call')
+
+
+def main() -> None:
+    for depth in DEPTHS:
+        bench('plain function', plain, depth)
+        bench('with SecureStringContextManager(False)', with_context_manager, depth)
+        bench('@unprotected', with_decorator, depth)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,66 @@
+from typing import Any, Dict, List
+import importlib
 from .secure_string_context import *
-from .secure_string_strict_context import SecureStringStrictContextManager
+from .secure_string_strict_context import (
+    SecureStringStrictContextManager,
+    SecureStringStrictRecorder,
+    SecureStringStrictRecordContextManager,
+    strict,
+)
 from .secure_string_itself import *
-from importlib.metadata import version
 
-__version__ = version("secure_strings")
+# Rarely used names are imported on first access, see `__getattr__`
+_LAZY_ATTRIBUTES: Dict[str, str] = {
+    'SecureStringProfiler': 'secure_string_profile',
+    'profile': 'secure_string_profile',
+    'SecureStringFingerprintMask': 'secure_string_mask',
+    'SecureStringFixedMask': 'secure_string_mask',
+    'fingerprint': 'secure_string_fingerprint',
+    'SecureStringObfuscated': 'secure_string_obfuscated',
+    'SecureField': 'secure_string_fields',
+    'secure_fields': 'secure_string_fields',
+    'SecureStringMapping': 'secure_string_load',
+    'load': 'secure_string_load',
+    'SecureStringRope': 'secure_string_rope',
+    'SecureTemplate': 'secure_string_template',
+    'SecureURL': 'secure_string_url',
+    'SecureStringRegistry': 'secure_string_registry',
+    'stats': 'secure_string_registry',
+    'track': 'secure_string_registry',
+    'SecureStringPassthrough': 'secure_string_passthrough',
+    'passthrough': 'secure_string_passthrough',
+    'SecureJSON': 'secure_string_json',
+    'iter_secure_rows': 'secure_string_tabular',
+    'mask_csv': 'secure_string_tabular',
+    'RotatingSecureString': 'secure_string_rotating',
+    'mask': 'secure_string_materialize',
+    'materialize': 'secure_string_materialize',
+    'reveal': 'secure_string_materialize',
+    'SecureStringEnvelope': 'secure_string_envelope',
+    'write_envelope': 'secure_string_envelope',
+    'module_policies': 'secure_string_module_policy',
+    'set_module_policy': 'secure_string_module_policy',
+    'SecureStringControlChannel': 'secure_string_control',
+    'SecureStringLastCharsMask': 'secure_string_mask',
+    'SecureStringLengthMask': 'secure_string_mask',
+}
+
+
+def __getattr__(name: str) -> Any:
+    value: Any
+
+    if name == '__version__':
+        from importlib.metadata import version
+        value = version("secure_strings")
+    elif name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(f'.{_LAZY_ATTRIBUTES[name]}', __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | {'__version__'})
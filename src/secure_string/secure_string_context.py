@@ -1,10 +1,17 @@
-from typing import Optional
+from typing import Optional, Any, Callable, Type, TypeVar
+from functools import wraps
+import contextvars
 from global_manager import GlobalManager
 
 __all__ = (
     'SecureStringContextManager',
+    'unprotected',
 )
 
+_F = TypeVar('_F', bound=Callable[..., Any])
+
+_PROBE: Any = object()
+
 
 class SecureStringContextManager(GlobalManager[bool]):
     """
@@ -22,6 +29,9 @@ class SecureStringContextManager(GlobalManager[bool]):
         print(ss)  # 'my_password'
     ```
     """
+    _resolver: Optional[Callable[[], Optional[bool]]] = None
+    """decides the protection when there is no context, see `secure_string_module_policy`"""
+
     @classmethod
     def is_protected(cls) -> bool:
         """
@@ -31,7 +41,119 @@ class SecureStringContextManager(GlobalManager[bool]):
         """
         is_protected: Optional[bool] = super().get_current_context()
 
+        if is_protected is None and cls._resolver is not None:
+            is_protected = cls._resolver()
+
         if is_protected is True or is_protected is None:
             return True  # by default the protection is on
 
         return False
+
+
+def _get_storage(manager: Type[GlobalManager]) -> Optional[contextvars.ContextVar]:
+    """
+    The ContextVar behind `get_current_context` of the manager, None if its layout is unknown.
+    global-manager 1.0.3 and 1.0.4 (the supported range, see pyproject.toml) create it in `__init__`.
+    """
+    manager(None)  # creates the storage, if it does not exist yet
+    storage: Any = vars(manager).get('_storage')
+    if not isinstance(storage, contextvars.ContextVar):
+        return None
+
+    token: contextvars.Token = storage.set(_PROBE)
+    try:
+        if manager.get_current_context() is not _PROBE:
+            return None  # pragma: no cover
+    finally:
+        storage.reset(token)
+
+    return storage
+
+
+def _scoped_public(manager: Type[GlobalManager], value: Any, func: _F, is_coroutine: bool) -> _F:
+    """`_scoped` through `__enter__` and `__exit__` of a manager per call"""
+    if is_coroutine:
+        @wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            scope: GlobalManager = manager(value)
+            scope.__enter__()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                scope.__exit__(None, None, None)
+
+        return async_wrapper  # type: ignore[return-value]
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        scope: GlobalManager = manager(value)
+        scope.__enter__()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            scope.__exit__(None, None, None)
+
+    return wrapper  # type: ignore[return-value]
+
+
+def _scoped(manager: Type[GlobalManager], value: Any, func: _F) -> _F:
+    """
+    Wraps the function so that the context of the manager is `value` during its calls.
+    Enter and exit are a single `ContextVar.set` and `ContextVar.reset` on the ContextVar of the manager,
+    see `_get_storage`; without it, managers are entered and exited through the public API.
+    While `__enter__` of the manager is replaced (by SecureStringProfiler, which counts the context depth),
+    calls go through the public API too, so scoped calls are counted as `with` blocks are.
+    """
+    import inspect  # not needed at import time
+
+    if inspect.isgeneratorfunction(func) or inspect.isasyncgenfunction(func):
+        raise TypeError('Generator functions are not supported, use the context manager inside them')
+
+    is_coroutine: bool = inspect.iscoroutinefunction(func)
+    public: Any = _scoped_public(manager, value, func, is_coroutine)
+    storage: Optional[contextvars.ContextVar] = _get_storage(manager)
+
+    if storage is None:
+        return public
+
+    enter: Any = inspect.unwrap(manager.__enter__)  # the unpatched one, even if the profiler is enabled now
+
+    if is_coroutine:
+        @wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            if manager.__enter__ is not enter:
+                return await public(*args, **kwargs)
+
+            token: contextvars.Token = storage.set(value)
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                storage.reset(token)
+
+        return async_wrapper  # type: ignore[return-value]
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if manager.__enter__ is not enter:
+            return public(*args, **kwargs)
+
+        token: contextvars.Token = storage.set(value)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            storage.reset(token)
+
+    return wrapper  # type: ignore[return-value]
+
+
+def unprotected(func: _F) -> _F:
+    """
+    Calls of the decorated function (or coroutine function) work in `SecureStringContextManager(False)`
+
+    ```py
+    @unprotected
+    def connect(password: SecureString) -> Connection:
+        return driver.connect(password=password)  # the driver gets the real value
+    ```
+    """
+    return _scoped(SecureStringContextManager, False, func)
@@ -0,0 +1,119 @@
+from typing import Dict, Any, Optional
+import mmap
+import os
+import signal
+from .secure_string_strict_context import SecureStringStrictContextManager, SecureStringStrictRecorder, _add_recording
+
+__all__ = (
+    'SecureStringControlChannel',
+)
+
+
+class SecureStringControlChannel:
+    """
+    Host-wide defaults of the strict mode in a memory-mapped flag file, shared by all processes, which open it.
+    A flag is read at the cost of one memory load, when there is no context of the strict mode.
+    Every flag has its own byte, so processes, which set different flags at once, do not lose each other's update.
+
+    `install` also handles signals: SIGUSR1 turns the record-only strict mode on, SIGUSR2 turns it off,
+    so `pkill -USR1 -f gunicorn` switches every worker on the host at once.
+
+    ```py
+    from secure_string import SecureStringControlChannel
+
+    channel = SecureStringControlChannel('/run/app/secure_string.flags')
+    channel.install()
+    ...
+    channel.recorder.sites()  # call sites of implicit accesses, recorded while RECORD is set
+    ```
+    """
+    RECORD: int = 1
+    """record implicit accesses by `recorder`, see SecureStringStrictRecorder"""
+    STRICT: int = 2
+    """the strict mode is on by default"""
+    _BYTES: Dict[int, int] = {RECORD: 0, STRICT: 1}
+    """flag -> its byte in the flag file"""
+
+    def __init__(self, path: str, recorder: Optional[SecureStringStrictRecorder] = None):
+        """
+        :param path: the flag file, it is created if it does not exist
+        :param recorder: used while the RECORD flag is set, a new SecureStringStrictRecorder by default
+        """
+        self.recorder: SecureStringStrictRecorder = SecureStringStrictRecorder() if recorder is None else recorder
+        self._previous_handlers: Dict[int, Any] = {}
+        """signal number -> the handler before `install`"""
+
+        fd: int = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if os.fstat(fd).st_size < len(self._BYTES):
+                os.ftruncate(fd, len(self._BYTES))  # does not clobber a flag written by another process meanwhile
+            self._mm: mmap.mmap = mmap.mmap(fd, len(self._BYTES))
+        finally:
+            os.close(fd)
+
+    @property
+    def flags(self) -> int:
+        return sum(flag for flag, index in self._BYTES.items() if self._mm[index])
+
+    @flags.setter
+    def flags(self, flags: int) -> None:
+        for flag, index in self._BYTES.items():
+            self._mm[index] = 1 if flags & flag else 0
+
+    @property
+    def record(self) -> bool:
+        return bool(self._mm[0])
+
+    @record.setter
+    def record(self, value: bool) -> None:
+        self._mm[0] = 1 if value else 0  # a single byte store, no read-modify-write
+
+    @property
+    def strict(self) -> bool:
+        return bool(self._mm[1])
+
+    @strict.setter
+    def strict(self, value: bool) -> None:
+        self._mm[1] = 1 if value else 0
+
+    def install(self, signals: bool = True) -> None:
+        """
+        Makes the flags the process-wide defaults
+
+        :param signals: handle SIGUSR1 and SIGUSR2 (where they exist), must be called from the main thread then
+        """
+        if SecureStringStrictContextManager._channel is not self:
+            if SecureStringStrictContextManager._channel is None:
+                _add_recording(1)
+            SecureStringStrictContextManager._channel = self
+
+        if signals and hasattr(signal, 'SIGUSR1'):
+            for signum, value in ((signal.SIGUSR1, True), (signal.SIGUSR2, False)):
+                if signum not in self._previous_handlers:  # a repeated call keeps the original handler
+                    self._previous_handlers[signum] = signal.signal(signum, self._signal_handler(value))
+
+    def uninstall(self) -> None:
+        """Restores the defaults and signal handlers"""
+        if SecureStringStrictContextManager._channel is self:
+            SecureStringStrictContextManager._channel = None
+            _add_recording(-1)
+
+        while self._previous_handlers:
+            signum, handler = self._previous_handlers.popitem()
+            signal.signal(signum, handler)
+
+    def close(self) -> None:
+        self.uninstall()
+        self._mm.close()
+
+    def __enter__(self) -> 'SecureStringControlChannel':
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    def _signal_handler(self, value: bool) -> Any:
+        def handler(_signum: int, _frame: Any) -> None:
+            self.record = value
+
+        return handler
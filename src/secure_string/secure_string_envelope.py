@@ -0,0 +1,240 @@
+"""
+Encrypted envelope files: a local cache of secrets, e.g. for restarts without the secret manager.
+
+Limitation: the format is an encrypt-then-MAC construction built from the standard library only,
+a SHAKE-256 keystream (see `secure_string_keystream`) and HMAC-SHA256 with separate derived keys.
+It is not a vetted AEAD (such as AES-GCM or ChaCha20-Poly1305) and has not been audited:
+use it against accidental disclosure of cached files, not as a replacement for a secret manager or disk encryption.
+"""
+from typing import Any, List, Mapping, Optional, Tuple, Union
+import hashlib
+import hmac
+import mmap
+import os
+import struct
+import tempfile
+from .secure_string_itself import SecureString
+from .secure_string_exceptions import SecureStringEnvelopeError
+from .secure_string_keystream import xor_keystream
+
+__all__ = (
+    'SecureStringEnvelope',
+    'write_envelope',
+)
+
+_PathType = Union[str, 'os.PathLike[str]']
+_KeyType = Union[bytes, str, SecureString]
+
+# File layout (little-endian):
+#   header   magic(6) version(u16) count(u32) reserved(u32) salt(16)
+#   index    count * (name digest(8) record offset(u64) record length(u32)), sorted by digest
+#   MAC      HMAC-SHA256 of the header and the index
+#   records  nonce(16) ciphertext tag(32), tag is HMAC-SHA256 of the name, the nonce and the ciphertext
+_MAGIC: bytes = b'SSENV\x00'
+_VERSION: int = 1
+_HEADER = struct.Struct('<6sHII16s')
+_ENTRY = struct.Struct('<8sQI')
+_MAC_SIZE: int = 32
+_NONCE_SIZE: int = 16
+
+
+def _derive_keys(key: _KeyType, salt: bytes) -> Tuple[bytes, bytes]:
+    """(encryption key, MAC key)"""
+    if isinstance(key, SecureString):
+        # noinspection PyProtectedMember
+        key = key._orig_value
+    if isinstance(key, str):
+        key = key.encode('utf-8')
+
+    return (
+        hmac.new(key, b'secure-string envelope encryption' + salt, hashlib.sha256).digest(),
+        hmac.new(key, b'secure-string envelope authentication' + salt, hashlib.sha256).digest(),
+    )
+
+
+def _name_digest(mac_key: bytes, name: str) -> bytes:
+    return hmac.new(mac_key, b'name:' + name.encode('utf-8'), hashlib.sha256).digest()[:8]
+
+
+def _record_tag(mac_key: bytes, name: str, nonce: bytes, ciphertext: Any) -> bytes:
+    encoded_name: bytes = name.encode('utf-8')
+    mac = hmac.new(mac_key, struct.pack('<I', len(encoded_name)) + encoded_name + nonce, hashlib.sha256)
+    mac.update(ciphertext)
+    return mac.digest()
+
+
+def write_envelope(path: _PathType, key: _KeyType, secrets: Mapping[str, Union[str, SecureString]]) -> None:
+    """
+    Atomically writes secrets into an encrypted envelope file:
+    a temporary file in the same directory is fsynced and renamed over `path`.
+
+    ```py
+    write_envelope('/var/cache/app/secrets.env', local_key, {'db_password': SecureString('my password')})
+    ```
+
+    :param key: the local key, bytes, str or SecureString
+    """
+    salt: bytes = os.urandom(16)
+    enc_key, mac_key = _derive_keys(key, salt)
+
+    records: List[bytes] = []
+    entries: List[Tuple[bytes, int]] = []  # (name digest, record number)
+    for name, value in secrets.items():
+        # noinspection PyProtectedMember
+        plaintext: str = value._orig_value if isinstance(value, SecureString) else value
+        nonce: bytes = os.urandom(_NONCE_SIZE)
+        ciphertext: bytes = xor_keystream(enc_key, nonce, plaintext.encode('utf-8'))
+        entries.append((_name_digest(mac_key, name), len(records)))
+        records.append(nonce + ciphertext + _record_tag(mac_key, name, nonce, ciphertext))
+
+    header: bytes = _HEADER.pack(_MAGIC, _VERSION, len(records), 0, salt)
+    offset: int = _HEADER.size + _ENTRY.size * len(records) + _MAC_SIZE
+    offsets: List[int] = []
+    for record in records:
+        offsets.append(offset)
+        offset += len(record)
+
+    index: bytes = b''.join(
+        _ENTRY.pack(digest, offsets[number], len(records[number])) for digest, number in sorted(entries)
+    )
+    index_mac: bytes = hmac.new(mac_key, header + index, hashlib.sha256).digest()
+
+    path = os.fspath(path)
+    directory: str = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f'.{os.path.basename(path)}.')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(header)
+            f.write(index)
+            f.write(index_mac)
+            for record in records:
+                f.write(record)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    if hasattr(os, 'O_DIRECTORY'):  # the rename itself has to be durable
+        dir_fd: int = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+class SecureStringEnvelope:
+    """
+    Reader of an encrypted envelope file, see `write_envelope`.
+    The file is memory-mapped, a lookup binary searches the index and decrypts only one record.
+
+    ```py
+    with SecureStringEnvelope('/var/cache/app/secrets.env', local_key) as envelope:
+        envelope['db_password']  # SecureString
+    ```
+    """
+    def __init__(self, path: _PathType, key: _KeyType, secure_string_class: type = SecureString):
+        """
+        :raise SecureStringEnvelopeError: the file is not an envelope, is corrupted or the key is wrong
+        """
+        self._secure_string_class: type = secure_string_class
+
+        with open(path, 'rb') as f:
+            try:
+                self._mm: mmap.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # an empty file
+                raise SecureStringEnvelopeError('Not an envelope file') from None
+
+        try:
+            if len(self._mm) < _HEADER.size:
+                raise SecureStringEnvelopeError('Not an envelope file')
+
+            magic, version, self._count, _reserved, salt = _HEADER.unpack_from(self._mm, 0)
+            if magic != _MAGIC or version != _VERSION:
+                raise SecureStringEnvelopeError('Not an envelope file or an unsupported version')
+
+            self._enc_key, self._mac_key = _derive_keys(key, salt)
+            index_end: int = _HEADER.size + _ENTRY.size * self._count
+            if len(self._mm) < index_end + _MAC_SIZE:
+                raise SecureStringEnvelopeError('The envelope file is truncated')
+
+            mac = hmac.new(self._mac_key, self._mm[:index_end], hashlib.sha256).digest()
+            if not hmac.compare_digest(mac, self._mm[index_end:index_end + _MAC_SIZE]):
+                raise SecureStringEnvelopeError('The envelope index is corrupted or the key is wrong')
+        except BaseException:
+            self._mm.close()
+            raise
+
+    def __enter__(self) -> 'SecureStringEnvelope':
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._mm.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _entry(self, number: int) -> Tuple[bytes, int, int]:
+        return _ENTRY.unpack_from(self._mm, _HEADER.size + _ENTRY.size * number)
+
+    def get(self, name: str, default: Optional[SecureString] = None) -> Optional[SecureString]:
+        """
+        :raise SecureStringEnvelopeError: the record is corrupted, also if every record with the name's digest fails
+        """
+        digest: bytes = _name_digest(self._mac_key, name)
+
+        low, high = 0, self._count
+        while low < high:  # the first entry with the digest
+            middle: int = (low + high) // 2
+            if self._entry(middle)[0] < digest:
+                low = middle + 1
+            else:
+                high = middle
+
+        candidates: List[Tuple[int, int]] = []
+        while low < self._count:
+            entry_digest, offset, length = self._entry(low)
+            if entry_digest != digest:
+                break
+            candidates.append((offset, length))
+            low += 1
+
+        for offset, length in candidates:
+            value: Optional[str] = self._open_record(name, offset, length)
+            if value is not None:
+                return self._secure_string_class(value)
+
+        if candidates:  # none of the records with the digest belongs to the name
+            raise SecureStringEnvelopeError('The envelope record is corrupted')
+
+        return default
+
+    def _open_record(self, name: str, offset: int, length: int) -> Optional[str]:
+        """
+        :return: None if the record does not belong to the name (a digest collision or a corruption)
+        :raise SecureStringEnvelopeError: the record is truncated
+        """
+        if length < _NONCE_SIZE + _MAC_SIZE or offset + length > len(self._mm):
+            raise SecureStringEnvelopeError('The envelope record is corrupted')
+
+        nonce: bytes = self._mm[offset:offset + _NONCE_SIZE]
+        ciphertext: bytes = self._mm[offset + _NONCE_SIZE:offset + length - _MAC_SIZE]
+        tag: bytes = self._mm[offset + length - _MAC_SIZE:offset + length]
+
+        if not hmac.compare_digest(tag, _record_tag(self._mac_key, name, nonce, ciphertext)):
+            return None
+
+        return xor_keystream(self._enc_key, nonce, ciphertext).decode('utf-8')
+
+    def __getitem__(self, name: str) -> SecureString:
+        value: Optional[SecureString] = self.get(name)
+        if value is None:
+            raise KeyError(name)
+        return value
+
+    def __contains__(self, name: str) -> bool:
+        return self.get(name) is not None
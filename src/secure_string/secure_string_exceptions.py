@@ -1,3 +1,13 @@
 class SecureStringDoesNotSupportError(TypeError):
     """SecureString string does not support a method or function"""
     pass
+
+
+class SecureStringExpiredError(ValueError):
+    """The value of an expired SecureString is not available anymore"""
+    pass
+
+
+class SecureStringEnvelopeError(ValueError):
+    """An envelope file is corrupted, tampered with or encrypted with another key"""
+    pass
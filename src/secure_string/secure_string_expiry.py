@@ -0,0 +1,104 @@
+from typing import Optional, List, Tuple, Any
+from time import monotonic
+import heapq
+import itertools
+import os
+import threading
+import weakref
+
+__all__ = (
+    'SecureStringSweeper',
+    'get_sweeper',
+)
+
+
+class SecureStringSweeper:
+    """
+    Drops original values of expired SecureStrings.
+
+    Pending expirations are kept in one heap ordered by deadline (O(log n) scheduling),
+    a single background daemon thread sleeps until the nearest deadline.
+    """
+    def __init__(self) -> None:
+        self._heap: List[Tuple[float, int, Any]] = []
+        """(monotonic deadline, sequence number, weak reference to a SecureString)"""
+        self._counter = itertools.count()
+        """sequence numbers, keeps heap entries comparable"""
+        self._condition: threading.Condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        """the number of pending expirations"""
+        return len(self._heap)
+
+    def schedule(self, secure_string: Any, deadline: float) -> None:
+        """
+        Drops the original value of a SecureString at the deadline
+
+        :param deadline: `time.monotonic()` based deadline
+        """
+        entry: Tuple[float, int, Any] = (deadline, next(self._counter), weakref.ref(secure_string))
+
+        with self._condition:
+            heapq.heappush(self._heap, entry)
+
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='SecureStringSweeper', daemon=True)
+                self._thread.start()
+            elif self._heap[0] is entry:
+                self._condition.notify()  # the nearest deadline has changed
+
+    def sweep(self, now: Optional[float] = None) -> int:
+        """
+        Drops original values of SecureStrings expired by now
+
+        :return: the number of processed expirations
+        """
+        if now is None:
+            now = monotonic()
+
+        expired: List[Any] = []
+        with self._condition:
+            while self._heap and self._heap[0][0] <= now:
+                expired.append(heapq.heappop(self._heap)[2])
+
+        for ref in expired:
+            secure_string: Any = ref()
+            if secure_string is not None:
+                # noinspection PyProtectedMember
+                secure_string._expire()
+
+        return len(expired)
+
+    def _run(self) -> None:  # pragma: no cover
+        while True:
+            with self._condition:
+                if not self._heap:
+                    self._condition.wait()
+                    continue
+
+                timeout: float = self._heap[0][0] - monotonic()
+                if timeout > 0:
+                    self._condition.wait(timeout)
+                    continue
+
+            self.sweep()
+
+    def _after_fork(self) -> None:  # pragma: no cover
+        """the sweeper thread does not survive fork"""
+        self._condition = threading.Condition()
+        self._thread = None
+        if self._heap:
+            self._thread = threading.Thread(target=self._run, name='SecureStringSweeper', daemon=True)
+            self._thread.start()
+
+
+_sweeper: SecureStringSweeper = SecureStringSweeper()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_sweeper._after_fork)
+
+
+def get_sweeper() -> SecureStringSweeper:
+    """The process-wide sweeper"""
+    return _sweeper
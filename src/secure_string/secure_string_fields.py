@@ -0,0 +1,169 @@
+from typing import Any, Dict, List, Optional, Type
+import dataclasses
+import inspect
+from .secure_string_itself import SecureString
+
+__all__ = (
+    'SecureField',
+    'secure_fields',
+)
+
+SECURE_FIELD_METADATA_KEY: str = 'secure_string'
+"""the key of `dataclasses.Field.metadata`, the value is a SecureString class to wrap the field with"""
+
+
+# noinspection PyPep8Naming
+def SecureField(*, secure_string_class: Type[SecureString] = SecureString, **kwargs: Any) -> Any:
+    """
+    Marks a field of a `secure_fields` class, accepts the same arguments as `dataclasses.field`
+
+    :param secure_string_class: the class to wrap values with
+    """
+    metadata: Dict[Any, Any] = dict(kwargs.pop('metadata', None) or {})
+    metadata[SECURE_FIELD_METADATA_KEY] = secure_string_class
+    return dataclasses.field(metadata=metadata, **kwargs)
+
+
+def _secure_repr(value: Any) -> str:
+    if isinstance(value, SecureString):
+        return str.__repr__(value)  # repr of the fake value, does not depend on the mode
+
+    return repr(value)
+
+
+def _build_init(cls: type, secure: Dict[str, Type[SecureString]]) -> Dict[str, Any]:
+    """
+    compiles __init__, that wraps secure fields and calls the dataclass __init__;
+    defaults are wrapped by a compiled __post_init__ before the class' own `__post_init__`, if it has one
+
+    :return: method name -> function
+    """
+    namespace: Dict[str, Any] = {
+        '_init': cls.__init__,  # type: ignore[misc]
+        '_SecureString': SecureString,
+        '_setattr': object.__setattr__,
+    }
+    params: List[str] = []
+    args: List[str] = []
+    fixups: List[str] = []
+    keyword_only: bool = False
+
+    for param in list(inspect.signature(cls.__init__).parameters.values())[1:]:  # type: ignore[misc]
+        name: str = param.name
+        if param.kind is inspect.Parameter.KEYWORD_ONLY and not keyword_only:
+            keyword_only = True
+            params.append('*')
+
+        if param.default is inspect.Parameter.empty:
+            params.append(name)
+        else:
+            namespace[f'_default_{name}'] = param.default
+            params.append(f'{name}=_default_{name}')
+
+        if name not in secure:
+            args.append(f'{name}={name}')
+            continue
+
+        namespace[f'_class_{name}'] = secure[name]
+        args.append(
+            f'{name}=({name} if {name} is None or {name} is _default_{name} or isinstance({name}, _SecureString)'
+            f' else _class_{name}({name}))'
+            if param.default is not inspect.Parameter.empty else
+            f'{name}=({name} if {name} is None or isinstance({name}, _SecureString) else _class_{name}({name}))'
+        )
+        if param.default is not inspect.Parameter.empty:  # the default value or the default factory result
+            fixups.append(
+                f'    if self.{name} is not None and not isinstance(self.{name}, _SecureString):\n'
+                f'        _setattr(self, {name!r}, _class_{name}(self.{name}))\n'
+            )
+
+    post_init: Any = getattr(cls, '__post_init__', None)
+    source: str = (
+        f'def __init__(self, {", ".join(params)}):\n'
+        f'    _init(self, {", ".join(args)})\n'
+        + ('' if post_init is not None else ''.join(fixups))
+    )
+    if post_init is not None and fixups:  # the dataclass __init__ calls __post_init__ at its end
+        namespace['_post_init'] = post_init
+        source += (
+            'def __post_init__(self, *args, **kwargs):\n'
+            + ''.join(fixups)
+            + '    _post_init(self, *args, **kwargs)\n'
+        )
+
+    exec(source, namespace)
+    methods: Dict[str, Any] = {}
+    for name in ('__init__', '__post_init__'):
+        if name in namespace:
+            methods[name] = namespace[name]
+            methods[name].__qualname__ = f'{cls.__qualname__}.{name}'
+    return methods
+
+
+def _is_generated(function: Any) -> bool:
+    """the function is compiled by `dataclasses` (or by this module), not written by the user"""
+    code: Any = getattr(inspect.unwrap(function), '__code__', None)  # dataclasses wraps __repr__ with recursive_repr
+    return code is not None and code.co_filename == '<string>'
+
+
+def _build_repr(cls: type) -> Any:
+    """compiles __repr__, that shows fake values of secure fields in any mode"""
+    namespace: Dict[str, Any] = {'_secure_repr': _secure_repr}
+    parts: List[str] = [
+        f'{f.name}={{_secure_repr(self.{f.name})}}'
+        for f in dataclasses.fields(cls) if f.repr
+    ]
+    source: str = (
+        'def __repr__(self):\n'
+        f'    return f"{{self.__class__.__qualname__}}({", ".join(parts)})"\n'
+    )
+    exec(source, namespace)
+    repr_ = namespace['__repr__']
+    repr_.__qualname__ = f'{cls.__qualname__}.__repr__'
+    return repr_
+
+
+def secure_fields(cls: Optional[type] = None, **kwargs: Any) -> Any:
+    """
+    Class decorator, wraps `SecureField` fields of a dataclass into SecureString at construction.
+    `__init__` and `__repr__` are compiled once per class, a user-defined `__repr__` is kept.
+    Secure fields are wrapped before `__post_init__` is called, defaults included.
+
+    ```py
+    from secure_string import SecureField, secure_fields
+
+    @secure_fields
+    class Config:
+        user: str
+        password: str = SecureField()
+
+    config = Config('bob', 'my password')
+    config  # Config(user='bob', password='***')
+    config.password.value  # 'my password'
+    ```
+
+    :param kwargs: arguments of `dataclasses.dataclass`, if the class is not a dataclass yet
+    """
+    def wrap(cls_: type) -> type:
+        if not dataclasses.is_dataclass(cls_):
+            cls_ = dataclasses.dataclass(cls_, **kwargs)
+
+        has_repr: bool = '__repr__' in cls_.__dict__ and not _is_generated(cls_.__dict__['__repr__'])
+
+        secure: Dict[str, Type[SecureString]] = {
+            f.name: f.metadata[SECURE_FIELD_METADATA_KEY]
+            for f in dataclasses.fields(cls_) if SECURE_FIELD_METADATA_KEY in f.metadata
+        }
+        if cls_.__dict__.get('__init__') is not None and getattr(cls_, '__dataclass_params__').init:
+            for name, method in _build_init(cls_, secure).items():
+                setattr(cls_, name, method)
+
+        if not has_repr and getattr(cls_, '__dataclass_params__').repr:
+            setattr(cls_, '__repr__', _build_repr(cls_))
+
+        return cls_
+
+    if cls is None:
+        return wrap
+
+    return wrap(cls)
@@ -0,0 +1,42 @@
+from typing import Optional, Union
+import hashlib
+import hmac
+import os
+
+__all__ = (
+    'FINGERPRINT_KEY_ENV',
+    'fingerprint',
+)
+
+FINGERPRINT_KEY_ENV: str = 'SECURE_STRING_FINGERPRINT_KEY'
+"""environment variable with the per-deployment fingerprint key"""
+
+_process_key: Optional[bytes] = None
+"""the default fingerprint key, read from FINGERPRINT_KEY_ENV or a random one"""
+
+
+def _get_default_key() -> bytes:
+    global _process_key
+
+    if _process_key is None:
+        env_key: Optional[str] = os.environ.get(FINGERPRINT_KEY_ENV)
+        # without the per-deployment key fingerprints can be correlated only inside the process
+        _process_key = env_key.encode() if env_key else os.urandom(32)
+
+    return _process_key
+
+
+def fingerprint(value: str, key: Optional[Union[str, bytes]] = None, length: int = 8) -> str:
+    """
+    Keyed hash (HMAC-SHA256) of a value, the same value gives the same fingerprint with the same key.
+
+    :param value: a secret
+    :param key: the fingerprint key, by default the FINGERPRINT_KEY_ENV environment variable or a random per-process key
+    :param length: the number of hex digits
+    """
+    if key is None:
+        key = _get_default_key()
+    elif isinstance(key, str):
+        key = key.encode()
+
+    return hmac.new(key, value.encode(), hashlib.sha256).hexdigest()[:length]
@@ -1,15 +1,38 @@
-from typing import Optional, Tuple, Union, Iterable, List, TypeVar, Mapping, Sequence, Iterator, Any
+from typing import (
+    Optional, Tuple, Union, Iterable, List, TypeVar, Mapping, Sequence, Iterator, Any, Dict, FrozenSet, Type, Callable,
+    TYPE_CHECKING,
+)
 from functools import wraps
+from enum import Enum
+from datetime import datetime
+from time import monotonic, time
 from .secure_string_context import SecureStringContextManager
-from .secure_string_exceptions import SecureStringDoesNotSupportError
+from .secure_string_exceptions import SecureStringDoesNotSupportError, SecureStringExpiredError
 from .secure_string_strict_context import SecureStringStrictDecorator
 
+if TYPE_CHECKING:  # pragma: no cover
+    import hmac as _hmac
+
 __all__ = (
     'SecureString',
+    'SecureStringPolicy',
 )
 
 _T = TypeVar('_T')
 
+_POLICY_ATTRIBUTE: str = '_secure_string_policy'
+"""the attribute of a wrapped method, which keeps its SecureStringPolicy"""
+
+
+class SecureStringPolicy(str, Enum):
+    """How a method of SecureString behaves in the protected mode"""
+    FAKE = 'fake'
+    """the method works with the fake value"""
+    FORBID = 'forbid'
+    """the method raises SecureStringDoesNotSupportError"""
+    PASSTHROUGH = 'passthrough'
+    """the method works with the original value"""
+
 
 class SecureStringDoesNotSupportDecorator:
     """
@@ -31,6 +54,7 @@ class SecureStringDoesNotSupportDecorator:
                 raise SecureStringDoesNotSupportError(message)
             return func(*args, **kwargs)
 
+        setattr(wrapper, _POLICY_ATTRIBUTE, SecureStringPolicy.FORBID)
         return wrapper
 
 
@@ -56,37 +80,364 @@ class SecureStringBehaviourDecorator:
                 # noinspection PyProtectedMember
                 return getattr(self_._orig_value, func.__name__)(*right_args, **right_kwargs)
 
+        setattr(wrapper, _POLICY_ATTRIBUTE, SecureStringPolicy.FAKE)
         return wrapper
 
 
+class SecureStringPassthroughDecorator:
+    """
+    Decorator, wrap a magic method to always use the orig behavior
+    """
+    def __call__(self, func):
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any):
+            self_: 'SecureString' = args[0]
+            # noinspection PyProtectedMember
+            right_args = [(a._orig_value if isinstance(a, SecureString) else a) for a in args[1:]]
+            right_kwargs = {k: (v._orig_value if isinstance(v, SecureString) else v) for k, v in kwargs.items()}
+            # noinspection PyProtectedMember
+            return getattr(self_._orig_value, func.__name__)(*right_args, **right_kwargs)
+
+        setattr(wrapper, _POLICY_ATTRIBUTE, SecureStringPolicy.PASSTHROUGH)
+        return wrapper
+
+
+def _fake_policy(func):
+    """Tags a method, which implements the fake behaviour itself, with SecureStringPolicy.FAKE"""
+    setattr(func, _POLICY_ATTRIBUTE, SecureStringPolicy.FAKE)
+    return func
+
+
+def _compile_policy_method(name: str, policy: SecureStringPolicy):
+    """Builds a method of SecureString with the given policy"""
+    original: Any = vars(SecureString).get(name)
+    if policy is SecureStringPolicy.FAKE and getattr(original, _POLICY_ATTRIBUTE, None) is SecureStringPolicy.FAKE:
+        return original  # e.g. __add__, which builds a rope instead of adding the fake value
+
+    def func(*args: Any, **kwargs: Any) -> Any:
+        pass  # pragma: no cover
+
+    func.__name__ = name
+    func.__qualname__ = f'SecureString.{name}'
+
+    if policy is SecureStringPolicy.FAKE:
+        return SecureStringStrictDecorator()(SecureStringBehaviourDecorator()(func))
+
+    if policy is SecureStringPolicy.FORBID:
+        return SecureStringStrictDecorator()(SecureStringDoesNotSupportDecorator()(SecureStringBehaviourDecorator()(func)))
+
+    return SecureStringStrictDecorator()(SecureStringPassthroughDecorator()(func))
+
+
+_GENERATE_BLOCK_SIZE: int = 64 * 1024
+"""bytes drawn from `os.urandom` at once by `SecureString.generate_many`"""
+
+_policy_classes: Dict[Tuple[type, FrozenSet[Tuple[str, SecureStringPolicy]]], Type['SecureString']] = {}
+"""(base class, policy table) -> compiled subclass"""
+
+
+def _generate_urlsafe(n: int, nbytes: int) -> Iterator[Tuple[str, int]]:
+    """(chunk of concatenated tokens, token length), see `SecureString.generate_many`"""
+    import math
+    import os
+    from base64 import urlsafe_b64encode
+
+    per_block: int = max(1, _GENERATE_BLOCK_SIZE // max(nbytes, 1))
+    length: int = math.ceil(nbytes * 4 / 3)
+
+    while n > 0:
+        count: int = min(n, per_block)
+        n -= count
+        block: bytes = os.urandom(count * nbytes)
+
+        if nbytes % 3 == 0:  # no padding, tokens can be encoded at once
+            yield urlsafe_b64encode(block).decode('ascii'), length
+        else:
+            yield ''.join(
+                urlsafe_b64encode(block[i:i + nbytes]).decode('ascii')[:length]
+                for i in range(0, len(block), nbytes)
+            ), length
+
+
+def _check_alphabet(alphabet: str) -> None:
+    """
+    :raise ValueError: the alphabet cannot be used by `_generate_alphabet`
+    """
+    size: int = len(alphabet)
+    if not 2 <= size <= 256 or len(set(alphabet)) != size or not alphabet.isascii():
+        raise ValueError('alphabet must have from 2 to 256 unique ASCII characters')
+
+
+def _generate_alphabet(n: int, nbytes: int, alphabet: str) -> Iterator[Tuple[str, int]]:
+    """(chunk of concatenated tokens, token length), see `SecureString.generate_many`"""
+    import math
+    import os
+
+    size: int = len(alphabet)
+    length: int = max(1, math.ceil(nbytes * 8 / math.log2(size)))
+    # rejection sampling: bytes above the largest multiple of the size are dropped to avoid a bias
+    limit: int = 256 // size * size
+    table: bytes = bytes(ord(alphabet[b % size]) if b < limit else 0 for b in range(256))
+    delete: bytes = bytes(range(limit, 256))
+
+    pending: str = ''
+    per_block: int = max(1, _GENERATE_BLOCK_SIZE // length)
+    while n > 0:
+        count: int = min(n, per_block)
+        needed: int = count * length
+        while len(pending) < needed:
+            draw: int = (needed - len(pending)) * 256 // limit + 16
+            pending += os.urandom(draw).translate(table, delete).decode('ascii')
+
+        n -= count
+        yield pending[:needed], length
+        pending = pending[needed:]
+
+
+def _instantiate(cls: Type[_T], chunks: Iterator[Tuple[str, int]], kwargs: Dict[str, Any]) -> Iterator[_T]:
+    """splits chunks into tokens, see `SecureString.generate_many`"""
+    for chunk, length in chunks:
+        for start in range(0, len(chunk), length):
+            yield cls(chunk[start:start + length], **kwargs)  # type: ignore[call-arg]
+
+
+class _ExpiringValue:
+    """
+    `_orig_value` of SecureStrings with a deadline, every read goes through the expiry check.
+    Other instances keep `_orig_value` in `__dict__`, which wins over this non-data descriptor.
+    """
+    def __get__(self, instance: Optional['SecureString'], owner: Any = None) -> str:
+        if instance is None:
+            return ''
+
+        # noinspection PyProtectedMember
+        instance._check_expired()
+        return instance.__dict__.get('_expiring_value', '')
+
+
 class SecureString(str):
     """String that protects passwords from accidentally getting into logs """
     _fake_value: str = '***'
-    _orig_value: str = ''
+    _orig_value: str = _ExpiringValue()  # type: ignore[assignment]
+    _mask: Optional[Callable[[str], str]] = None
+    """computes the fake value of an instance from the original value, `_fake_value` is used if it is None"""
+    _expires_at: Optional[float] = None
+    """`time.monotonic()` based deadline, None - never expires"""
+
+    def __new__(
+        cls,
+        *args,
+        mask: Optional[Callable[[str], str]] = None,
+        ttl: Optional[float] = None,
+        expires_at: Optional[Union[float, datetime]] = None,
+        **kwargs,
+    ):
+        """
+        :param mask: computes the fake value once, see `secure_string_mask`
+        :param ttl: the value expires in `ttl` seconds
+        :param expires_at: the value expires at the timestamp or datetime
+        """
+        if mask is None:
+            mask = cls._mask
+
+        if mask is None:
+            str_ = super().__new__(cls, cls._fake_value)
+        else:
+            fake_value: str = mask(args[0])
+            str_ = super().__new__(cls, fake_value)
+            str_._fake_value = fake_value
+            str_._mask = mask
+
+        if expires_at is not None:
+            if isinstance(expires_at, datetime):
+                expires_at = expires_at.timestamp()
+            ttl = expires_at - time() if ttl is None else min(ttl, expires_at - time())
+
+        if ttl is None:
+            str_._orig_value = args[0]
+        else:
+            from .secure_string_expiry import get_sweeper
+            str_._expires_at = monotonic() + ttl
+            str_._store_expiring(args[0])
+            get_sweeper().schedule(str_, str_._expires_at)
 
-    def __new__(cls, *args, **kwargs):
-        str_ = super().__new__(cls, cls._fake_value)
-        str_._orig_value = args[0]
         return str_
 
+    def _store_expiring(self, value: str) -> None:
+        """keeps the original value of an instance with a deadline, see `_ExpiringValue`"""
+        self.__dict__['_expiring_value'] = value
+
+    def _check_expired(self) -> None:
+        """
+        :raise SecureStringExpiredError: the value has expired
+        """
+        if self._expires_at is not None and self._expires_at <= monotonic():
+            raise SecureStringExpiredError('SecureString has expired')
+
     @property
     def value(self) -> str:
         """
         the real value
 
         :raise AttributeError:
+        :raise SecureStringExpiredError: the value has expired
         """
+        self._check_expired()
+
         if SecureStringContextManager.is_protected():
             return self._orig_value
 
         return getattr(super(), 'value')
 
+    @property
+    def expired(self) -> bool:
+        """the value has expired, see `ttl` and `expires_at`"""
+        return self._expires_at is not None and self._expires_at <= monotonic()
+
+    def _expire(self) -> None:
+        """drops the original value, called by the sweeper; later reads raise SecureStringExpiredError"""
+        self.__dict__.pop('_orig_value', None)
+        self.__dict__.pop('_expiring_value', None)
+        self.__dict__.pop('_hmac_states', None)
+
+        now: float = monotonic()
+        if self._expires_at is None or self._expires_at > now:
+            self._expires_at = now
+
+    def hmac(self, digestmod: Any) -> '_hmac.HMAC':
+        """
+        A fresh HMAC object keyed by the real value.
+        The keyed state (the inner and outer pads) is computed once per instance and digestmod,
+        each call returns its cheap copy, so the key is not processed again per message.
+
+        ```py
+        signature = key.hmac('sha256')
+        for chunk in body_chunks:
+            signature.update(chunk)
+        signature.hexdigest()
+        ```
+
+        :param digestmod: as in `hmac.new`, e.g. 'sha256' or `hashlib.sha256`
+        :raise SecureStringExpiredError: the value has expired
+        """
+        self._check_expired()
+        import hmac  # not needed at import time
+
+        states: Dict[Any, _hmac.HMAC] = self.__dict__.setdefault('_hmac_states', {})
+        state: Optional[_hmac.HMAC] = states.get(digestmod)
+        if state is None:
+            state = states.setdefault(digestmod, hmac.new(self._orig_value.encode('utf-8'), digestmod=digestmod))
+
+        return state.copy()
+
+    def _copy(self) -> 'SecureString':
+        if self.expired:
+            return self  # there is no value to copy
+
+        ttl: Optional[float] = None if self._expires_at is None else self._expires_at - monotonic()
+        return self.__class__(self._orig_value, mask=self._mask, ttl=ttl)
+
+    @classmethod
+    def generate_many(
+        cls: Type[_T], n: int, nbytes: int = 32, alphabet: Optional[str] = None, **kwargs: Any,
+    ) -> Iterator[_T]:
+        """
+        Generates `n` random tokens as SecureStrings.
+        Entropy is drawn from `os.urandom` in large blocks and encoded in bulk, not per token.
+
+        ```py
+        tokens = list(SecureString.generate_many(1000))  # as `secrets.token_urlsafe(32)`
+        pins = SecureString.generate_many(1000, nbytes=4, alphabet='0123456789')
+        ```
+
+        :param nbytes: random bytes per token, with an alphabet tokens have at least the same entropy
+        :param alphabet: ASCII characters of tokens, url-safe base64 without padding by default
+        :param kwargs: passed to the class, e.g. `mask` or `ttl`
+        :raise ValueError: a wrong n, alphabet or nbytes, at call time
+        """
+        if n < 0:
+            raise ValueError('n must not be negative')
+
+        if nbytes <= 0:
+            raise ValueError('nbytes must be positive')
+
+        if alphabet is None:
+            chunks: Iterator[Tuple[str, int]] = _generate_urlsafe(n, nbytes)
+        else:
+            _check_alphabet(alphabet)
+            chunks = _generate_alphabet(n, nbytes, alphabet)
+
+        return _instantiate(cls, chunks, kwargs)
+
+    @classmethod
+    def policy(cls) -> Dict[str, SecureStringPolicy]:
+        """method name -> its SecureStringPolicy"""
+        result: Dict[str, SecureStringPolicy] = {}
+
+        for name in dir(cls):
+            policy: Optional[SecureStringPolicy] = getattr(getattr(cls, name, None), _POLICY_ATTRIBUTE, None)
+            if policy is not None:
+                result[name] = policy
+
+        return result
+
+    @classmethod
+    def with_policy(
+        cls,
+        policy: Optional[Mapping[str, Union[str, SecureStringPolicy]]] = None,
+        **kwargs: Union[str, SecureStringPolicy],
+    ) -> Type['SecureString']:
+        """
+        A subclass with changed policies of methods.
+        Subclasses are built once and cached, so policies cost nothing on method calls.
+
+        ```py
+        ValidatedSecureString = SecureString.with_policy(__len__='passthrough')
+        len(ValidatedSecureString('my password'))  # 11
+        ```
+
+        :param policy: method name -> SecureStringPolicy
+        :raise ValueError: a method does not support policies or an unknown policy
+        """
+        current: Dict[str, SecureStringPolicy] = cls.policy()
+        table: Dict[str, SecureStringPolicy] = {}
+
+        for name, value in dict(policy or {}, **kwargs).items():
+            if name not in current:
+                raise ValueError(f'Method "{name}" does not support policies')
+
+            if SecureStringPolicy(value) is not current[name]:
+                table[name] = SecureStringPolicy(value)
+
+        if not table:
+            return cls
+
+        key: Tuple[type, FrozenSet[Tuple[str, SecureStringPolicy]]] = (cls, frozenset(table.items()))
+        policy_class: Optional[Type[SecureString]] = _policy_classes.get(key)
+
+        if policy_class is None:
+            namespace: Dict[str, Any] = {name: _compile_policy_method(name, p) for name, p in table.items()}
+            namespace['__hash__'] = cls.__hash__  # defining __eq__ resets __hash__
+            namespace['__module__'] = cls.__module__
+            suffix: str = ','.join(f'{name}={p.value}' for name, p in sorted(table.items()))
+            policy_class = _policy_classes[key] = type(f'{cls.__name__}[{suffix}]', (cls,), namespace)
+
+        return policy_class
+
     @SecureStringStrictDecorator()
-    @SecureStringBehaviourDecorator()
+    @_fake_policy
     def __add__(self, other) -> str:
         # Why not raise an error?
         # Sometimes one uses 's1 + s2 + s2' to format log messages and etc., instead of interpolation or f-strings
-        return ''  # fake return  # pragma: no cover
+        # In the protected mode the result is a SecureStringRope, which keeps the pieces and joins them only on demand
+        if not isinstance(other, str):
+            return NotImplemented
+
+        if not SecureStringContextManager.is_protected():
+            return self._orig_value + (other._orig_value if isinstance(other, SecureString) else other)
+
+        from .secure_string_rope import SecureStringRope
+        return SecureStringRope(self, other)
 
     # __class__ not needed
 
@@ -134,7 +485,15 @@ class SecureString(str):
     @SecureStringStrictDecorator()
     def __hash__(self) -> int:
         """A secure string can be a dict key"""
-        return self._orig_value.__hash__()
+        return self._hash()
+
+    def _hash(self) -> int:
+        """the hash of the original value, cached to stay stable after expiry"""
+        cached: Optional[int] = self.__dict__.get('_hash_value')
+        if cached is None:
+            cached = self.__dict__['_hash_value'] = self._orig_value.__hash__()
+
+        return cached
 
     # __init__ not needed
     # __init_subclass__  not needed
@@ -185,10 +544,14 @@ class SecureString(str):
         # A string does not have __radd__, method, but it need to be added
         # Why not raise an error?
         # Sometimes one uses 's1 + s2 + s2' to format log messages and etc., instead of interpolation or f-strings
-        if SecureStringContextManager.is_protected():
-            return other + self._fake_value
+        if not isinstance(other, str):
+            return NotImplemented
+
+        if not SecureStringContextManager.is_protected():
+            return other + self._orig_value
 
-        return other + self._orig_value
+        from .secure_string_rope import SecureStringRope
+        return SecureStringRope(other, self)
 
     @SecureStringStrictDecorator()
     @SecureStringDoesNotSupportDecorator()
@@ -219,9 +582,14 @@ class SecureString(str):
         return ''  # fake return  # pragma: no cover
 
     @SecureStringStrictDecorator()
-    @SecureStringBehaviourDecorator()
     def __sizeof__(self) -> int:
-        return 0  # fake return  # pragma: no cover
+        """The real footprint: the fake value and the original value, in the protected and unprotected modes"""
+        return str.__sizeof__(self) + self._plaintext_sizeof()
+
+    def _plaintext_sizeof(self) -> int:
+        """memory held by the original value"""
+        orig_value: Optional[str] = self.__dict__.get('_orig_value', self.__dict__.get('_expiring_value'))
+        return 0 if orig_value is None else orig_value.__sizeof__()
 
     @SecureStringStrictDecorator()
     @SecureStringBehaviourDecorator()
@@ -518,7 +886,7 @@ class SecureString(str):
     @SecureStringStrictDecorator()
     def __copy__(self):
         if SecureStringContextManager.is_protected():
-            return SecureString(self.value)
+            return self._copy()
 
         return self._orig_value
 
@@ -526,7 +894,7 @@ class SecureString(str):
     @SecureStringStrictDecorator()
     def __deepcopy__(self, memodict=None):
         if SecureStringContextManager.is_protected():
-            return SecureString(self.value)
+            return self._copy()
 
         return self._orig_value
     # endregion copy
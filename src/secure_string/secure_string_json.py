@@ -0,0 +1,87 @@
+from typing import Any, Optional, Iterable, FrozenSet
+from types import MappingProxyType
+from time import monotonic
+import json
+from .secure_string_itself import SecureString
+
+__all__ = (
+    'SecureJSON',
+)
+
+
+class SecureJSON(SecureString):
+    """
+    JSON document with secrets, e.g. a service account key, parsed once on first access.
+
+    Values under sensitive keys are SecureStrings, other values are returned as is.
+    The parsed tree is read-only: objects are mappings, arrays are tuples.
+    The whole document is redacted when rendered in the protected mode.
+
+    ```py
+    from secure_string import SecureJSON
+
+    account = SecureJSON(open('service-account.json').read())
+    account['client_email']  # 'bot@project.iam.gserviceaccount.com'
+    account['private_key']  # SecureString, '***'
+    print(account)  # '***'
+    ```
+    """
+    SENSITIVE_KEYS: FrozenSet[str] = frozenset((
+        'access_token', 'api_key', 'client_secret', 'password', 'private_key', 'private_key_id', 'refresh_token',
+        'secret', 'token',
+    ))
+    """default sensitive keys"""
+    _sensitive: FrozenSet[str] = SENSITIVE_KEYS
+
+    def __new__(cls, *args, sensitive: Optional[Iterable[str]] = None, **kwargs):
+        """
+        :param sensitive: keys, values of which are secrets, `SENSITIVE_KEYS` by default
+        """
+        str_ = super().__new__(cls, *args, **kwargs)
+        if sensitive is not None:
+            str_._sensitive = frozenset(sensitive)
+        return str_
+
+    @property
+    def tree(self) -> Any:
+        """
+        The parsed document, secrets in it expire with the document
+
+        :raise json.JSONDecodeError:
+        :raise SecureStringExpiredError: the document has expired
+        """
+        self._check_expired()
+        tree: Any = self.__dict__.get('_tree')
+
+        if tree is None:
+            tree = self.__dict__['_tree'] = self._freeze(json.loads(self._orig_value), False)
+
+        return tree
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.tree[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.tree.get(key, default)
+
+    def _freeze(self, value: Any, sensitive: bool) -> Any:
+        if isinstance(value, dict):
+            return MappingProxyType({
+                k: self._freeze(v, sensitive or k in self._sensitive) for k, v in value.items()
+            })
+
+        if isinstance(value, list):
+            return tuple(self._freeze(v, sensitive) for v in value)
+
+        if sensitive and value is not None:
+            ttl: Optional[float] = None if self._expires_at is None else self._expires_at - monotonic()
+            return SecureString(value if isinstance(value, str) else json.dumps(value), ttl=ttl)
+
+        return value
+
+    def _expire(self) -> None:
+        super()._expire()
+        self.__dict__.pop('_tree', None)
+
+    def _copy(self) -> SecureString:
+        return self  # immutable
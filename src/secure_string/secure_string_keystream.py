@@ -0,0 +1,17 @@
+import hashlib
+
+__all__ = (
+    'xor_keystream',
+)
+
+
+def xor_keystream(key: bytes, nonce: bytes, data: bytes) -> bytes:
+    """
+    Encrypts or decrypts data with the SHAKE-256 keystream of the key and the nonce.
+    Never use the same key and nonce for different data.
+    """
+    if not data:
+        return b''
+
+    keystream: bytes = hashlib.shake_256(key + nonce).digest(len(data))
+    return (int.from_bytes(data, 'big') ^ int.from_bytes(keystream, 'big')).to_bytes(len(data), 'big')
@@ -0,0 +1,201 @@
+from typing import Optional, Union, Iterable, Iterator, Mapping, Dict, Tuple, Type, Pattern, List
+import base64
+import binascii
+import os
+import re
+from .secure_string_itself import SecureString
+
+__all__ = (
+    'SecureStringMapping',
+    'load',
+)
+
+_PathType = Union[str, 'os.PathLike[str]']
+
+_ENCODED_NAME: Pattern[str] = re.compile(r'(?P<name>.+?)(?:[._](?P<encoding>b64|base64|hex))?', re.IGNORECASE)
+"""a name with an optional encoding suffix: `TOKEN_B64`, `token.hex`"""
+
+_DOTENV_LINE: Pattern[str] = re.compile(r'\s*(?:export\s+)?(?P<name>[^\s=#]+)\s*=(?P<value>.*)')
+
+_DOTENV_QUOTED: Pattern[str] = re.compile(
+    r'\s*(?:"(?P<double>(?:[^"\\]|\\.)*)"|\'(?P<single>[^\']*)\')\s*(?:#.*)?'
+)
+
+_DOTENV_COMMENT: Pattern[str] = re.compile(r'\s+#.*')
+"""a comment of an unquoted value, `#` starts a comment only after whitespace: `abc#123` is a value"""
+
+
+def _decode(data: bytes, encoding: Optional[str]) -> str:
+    """
+    :raise ValueError: the value is not valid base64 or hex
+    """
+    if encoding is None:
+        return data.decode('utf-8')
+
+    try:
+        if encoding.lower() == 'hex':
+            return binascii.unhexlify(data.strip()).decode('utf-8')
+
+        return base64.b64decode(data.strip(), validate=True).decode('utf-8')
+    except binascii.Error as e:
+        raise ValueError(f'Can not decode a {encoding} value: {e}') from None
+
+
+def _split_name(name: str) -> Tuple[str, Optional[str]]:
+    """`TOKEN_B64` -> ('TOKEN', 'B64')"""
+    match = _ENCODED_NAME.fullmatch(name)
+    assert match is not None
+    return match.group('name'), match.group('encoding')
+
+
+def _compile(pattern: Optional[Union[str, Pattern[str], Iterable[str]]]) -> Optional[Pattern[str]]:
+    if pattern is None or isinstance(pattern, re.Pattern):
+        return pattern
+
+    if isinstance(pattern, str):
+        return re.compile(pattern)
+
+    return re.compile('|'.join(re.escape(name) for name in pattern))
+
+
+def _parse_dotenv(text: str) -> Iterator[Tuple[str, str]]:
+    for line in text.splitlines():
+        if not line.strip() or line.lstrip().startswith('#'):
+            continue
+
+        match = _DOTENV_LINE.fullmatch(line)
+        if match is None:
+            continue
+
+        name: str = match.group('name')
+        value: str = match.group('value')
+        quoted = _DOTENV_QUOTED.fullmatch(value)
+
+        if quoted is None:
+            yield name, _DOTENV_COMMENT.sub('', value).strip()
+        elif quoted.group('double') is not None:
+            yield name, re.sub(r'\\(.)', lambda m: '\n' if m.group(1) == 'n' else m.group(1), quoted.group('double'))
+        else:
+            yield name, quoted.group('single')
+
+
+class SecureStringMapping(Mapping[str, SecureString]):
+    """
+    Immutable mapping of loaded secrets.
+    Files of secret directories are read on first access.
+    """
+    def __init__(
+        self,
+        values: Dict[str, SecureString],
+        files: Dict[str, Tuple[str, Optional[str]]],
+        secure_string_class: Type[SecureString] = SecureString,
+    ):
+        self._values: Dict[str, SecureString] = values
+        """name -> loaded secret"""
+        self._files: Dict[str, Tuple[str, Optional[str]]] = files
+        """name -> (path, encoding) of not loaded yet secrets"""
+        self._secure_string_class: Type[SecureString] = secure_string_class
+
+    def __getitem__(self, name: str) -> SecureString:
+        value: Optional[SecureString] = self._values.get(name)
+        if value is not None:
+            return value
+
+        path, encoding = self._files[name]
+        with open(path, 'rb') as f:
+            data: bytes = f.read()
+
+        value = self._values[name] = self._secure_string_class(_decode(data, encoding).rstrip('\r\n'))
+        return value
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._values or name in self._files
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._values
+        yield from (name for name in self._files if name not in self._values)
+
+    def __len__(self) -> int:
+        return len(self._values) + sum(1 for name in self._files if name not in self._values)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({{{", ".join(f"{name!r}: {SecureString._fake_value!r}" for name in self)}}})'
+
+
+def load(
+    pattern: Optional[Union[str, Pattern[str], Iterable[str]]] = None,
+    *,
+    secrets_dir: Optional[Union[_PathType, Iterable[_PathType]]] = None,
+    dotenv: Optional[Union[_PathType, Iterable[_PathType]]] = None,
+    environ: Union[bool, Mapping[str, str]] = True,
+    secure_string_class: Type[SecureString] = SecureString,
+) -> SecureStringMapping:
+    """
+    Loads secrets from mounted secret directories, .env files and environment variables.
+    Later sources override earlier ones: secret directories, .env files, environment variables.
+
+    Names with `_B64`, `_BASE64`, `_HEX` (or `.b64`, ...) suffixes are decoded and stored without the suffix.
+
+    ```py
+    from secure_string import load
+
+    secrets = load(r'DB_.*|API_KEY', secrets_dir='/run/secrets', dotenv='.env')
+    secrets['DB_PASSWORD'].value
+    ```
+
+    :param pattern: a regex or names to load, secrets match it by full name (without encoding suffixes), None - all
+    :param secrets_dir: directories with a file per secret, files are read on first access
+    :param environ: load environment variables, or a mapping to load instead of `os.environ`;
+        without `pattern` environment variables with encoding suffixes, which can not be decoded, are skipped
+        (e.g. `COLOR_HEX=#ff0000`)
+    :raise ValueError: an encoded value can not be decoded
+    """
+    regex: Optional[Pattern[str]] = _compile(pattern)
+    values: Dict[str, SecureString] = {}
+    files: Dict[str, Tuple[str, Optional[str]]] = {}
+
+    def add(raw_name: str, value: str, requested: bool = True) -> None:
+        name, encoding = _split_name(raw_name)
+        if regex is None or regex.fullmatch(name):
+            if encoding:
+                try:
+                    value = _decode(value.encode('utf-8'), encoding)
+                except ValueError:
+                    if requested:
+                        raise
+                    return None
+
+            files.pop(name, None)
+            values[name] = secure_string_class(value)
+
+    for directory in _as_paths(secrets_dir):
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.startswith('.') or not entry.is_file():
+                    continue  # e.g. `..data` of kubernetes secrets
+
+                name, encoding = _split_name(entry.name)
+                if regex is None or regex.fullmatch(name):
+                    values.pop(name, None)
+                    files[name] = (entry.path, encoding)
+
+    for path in _as_paths(dotenv):
+        with open(path, encoding='utf-8') as f:
+            for raw_name, value in _parse_dotenv(f.read()):
+                add(raw_name, value)
+
+    if environ:
+        for raw_name, value in (os.environ if environ is True else environ).items():
+            add(raw_name, value, requested=regex is not None)
+
+    return SecureStringMapping(values, files, secure_string_class)
+
+
+def _as_paths(paths: Optional[Union[_PathType, Iterable[_PathType]]]) -> List[_PathType]:
+    if paths is None:
+        return []
+
+    if isinstance(paths, (str, os.PathLike)):
+        return [paths]
+
+    return list(paths)
@@ -0,0 +1,90 @@
+from typing import Optional, Union, Dict, Any
+from .secure_string_fingerprint import fingerprint, _get_default_key
+
+__all__ = (
+    'SecureStringFingerprintMask',
+    'SecureStringFixedMask',
+    'SecureStringLastCharsMask',
+    'SecureStringLengthMask',
+)
+
+
+class SecureStringFixedMask:
+    """
+    The same fake for every value
+
+    ```py
+    SecureString('my password', mask=SecureStringFixedMask('<hidden>'))  # '<hidden>'
+    ```
+    """
+    def __init__(self, fake: str = '***'):
+        self._fake: str = fake
+
+    def __call__(self, value: str) -> str:
+        return self._fake
+
+
+class SecureStringLastCharsMask:
+    """
+    Shows the last `n` characters of a value, values not longer than `n * 2` are masked completely
+
+    ```py
+    SecureString('4111111111111234', mask=SecureStringLastCharsMask(4))  # '************1234'
+    ```
+    """
+    def __init__(self, n: int = 4, char: str = '*'):
+        """
+        :raise ValueError: n is negative
+        """
+        if n < 0:
+            raise ValueError(f'n must not be negative, got {n}')
+
+        self._n: int = n
+        self._char: str = char
+
+    def __call__(self, value: str) -> str:
+        if len(value) <= self._n * 2:
+            return self._char * len(value)
+
+        return self._char * (len(value) - self._n) + value[len(value) - self._n:]
+
+
+class SecureStringLengthMask:
+    """
+    Keeps the length of a value
+
+    ```py
+    SecureString('my password', mask=SecureStringLengthMask())  # '***********'
+    ```
+    """
+    def __init__(self, char: str = '*'):
+        self._char: str = char
+
+    def __call__(self, value: str) -> str:
+        return self._char * len(value)
+
+
+class SecureStringFingerprintMask:
+    """
+    The fake with a keyed hash of a value, the same secrets have the same fakes in logs
+
+    ```py
+    SecureString('my password', mask=SecureStringFingerprintMask())  # '***3f1c9b0e'
+    ```
+
+    :param key: the fingerprint key, see `secure_string_fingerprint.fingerprint`
+    """
+    def __init__(self, key: Optional[Union[str, bytes]] = None, prefix: str = '***', length: int = 8):
+        self._key: Optional[Union[str, bytes]] = key
+        self._prefix: str = prefix
+        self._length: int = length
+
+    def __call__(self, value: str) -> str:
+        return self._prefix + fingerprint(value, key=self._key, length=self._length)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # the default key is resolved on pickling, so worker processes use the same key as this process
+        state: Dict[str, Any] = dict(self.__dict__)
+        if state['_key'] is None:
+            state['_key'] = _get_default_key()
+        return state
@@ -0,0 +1,104 @@
+from typing import Any, List, Set, Tuple, Mapping
+from types import MappingProxyType
+import copy
+from .secure_string_context import SecureStringContextManager
+from .secure_string_itself import SecureString
+from .secure_string_rotating import RotatingSecureString
+
+__all__ = (
+    'mask',
+    'materialize',
+    'reveal',
+)
+
+_ATOMIC_TYPES = frozenset((str, bytes, int, float, bool, type(None)))
+
+
+def _convert(obj: Any, revealed: bool, active: Set[int]) -> Any:
+    """
+    :param active: ids of containers being converted, a container referencing itself is kept as is there
+    """
+    cls = type(obj)
+
+    if cls in _ATOMIC_TYPES:
+        return obj
+
+    if isinstance(obj, SecureString):
+        # noinspection PyProtectedMember
+        return obj._orig_value if revealed else str.__str__(obj)  # the payload is the fake value
+
+    if isinstance(obj, RotatingSecureString):
+        return _convert(obj.current, revealed, active)
+
+    if not isinstance(obj, (Mapping, list, tuple, set, frozenset)) or id(obj) in active:
+        return obj
+
+    active.add(id(obj))
+    try:
+        if isinstance(obj, Mapping):
+            changed: bool = False
+            pairs: List[Tuple[Any, Any]] = []
+            for key, value in obj.items():
+                new_key, new_value = _convert(key, revealed, active), _convert(value, revealed, active)
+                changed = changed or new_key is not key or new_value is not value
+                pairs.append((new_key, new_value))
+            return _rebuild_mapping(obj, pairs) if changed else obj
+
+        items: List[Any] = [_convert(item, revealed, active) for item in obj]
+        if all(new is old for new, old in zip(items, obj)):
+            return obj
+        if isinstance(obj, tuple) and hasattr(obj, '_fields'):  # namedtuple
+            return cls(*items)
+        return cls(items)
+    finally:
+        active.discard(id(obj))
+
+
+def _rebuild_mapping(obj: Mapping, pairs: List[Tuple[Any, Any]]) -> Mapping:
+    """a mapping of the same type as `obj` with `pairs`, a dict if the type cannot be built from a dict"""
+    if type(obj) is dict:
+        return dict(pairs)
+
+    if isinstance(obj, dict):
+        result: dict = copy.copy(obj)  # keeps e.g. default_factory of a defaultdict
+        result.clear()
+        result.update(pairs)
+        return result
+
+    if isinstance(obj, MappingProxyType):
+        return MappingProxyType(dict(pairs))
+
+    result = dict(pairs)
+    try:
+        return type(obj)(result)  # type: ignore[call-arg]
+    except TypeError:
+        return result
+
+
+def reveal(obj: Any) -> Any:
+    """
+    Converts SecureStrings of a nested structure (mappings, lists, tuples, sets) into plain strings of original values.
+    Containers without SecureStrings are returned as is.
+
+    ```py
+    json.dumps(reveal({'user': 'bob', 'password': SecureString('my password')}))
+    # '{"user": "bob", "password": "my password"}'
+    ```
+    """
+    return _convert(obj, True, set())
+
+
+def mask(obj: Any) -> Any:
+    """Converts SecureStrings of a nested structure into plain strings of fake values, see `reveal`"""
+    return _convert(obj, False, set())
+
+
+def materialize(obj: Any) -> Any:
+    """
+    `reveal` or `mask` depending on the current mode, the mode is checked once.
+    Use it to pass structures to C-level consumers (`str.join`, `%`, `json`, `csv`), which ignore the mode.
+    """
+    if SecureStringContextManager.is_protected():
+        return mask(obj)
+
+    return reveal(obj)
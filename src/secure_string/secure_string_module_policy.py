@@ -0,0 +1,100 @@
+from typing import Dict, Any, Optional, Tuple
+import os
+import sys
+import threading
+import weakref
+from .secure_string_context import SecureStringContextManager
+
+__all__ = (
+    'module_policies',
+    'set_module_policy',
+)
+
+_PACKAGE_DIR: str = os.path.dirname(os.path.abspath(__file__))
+
+_SKIP: Any = object()
+"""the decision for code of this package, the caller is looked up further"""
+
+_policies: Dict[str, bool] = {}
+"""module name -> protection"""
+
+_decisions: Dict[int, Tuple[Any, Any]] = {}
+"""id of a code object -> (weak reference to the code object, protection, None - no policy, or _SKIP),
+entries are removed with their code objects, so the cache does not keep code alive or grow with dead code"""
+
+_lock: threading.Lock = threading.Lock()
+
+
+def _decide(frame: Any) -> Any:
+    if frame.f_code.co_filename.startswith(_PACKAGE_DIR):
+        return _SKIP
+
+    module: Optional[str] = frame.f_globals.get('__name__')
+    while module:  # the longest matching prefix: 'a.b.c', 'a.b', 'a'
+        if module in _policies:
+            return _policies[module]
+        module = module.rpartition('.')[0]
+
+    return None
+
+
+def _forget(decisions: Dict[int, Tuple[Any, Any]], key: int) -> Any:
+    def callback(ref: Any) -> None:
+        entry: Optional[Tuple[Any, Any]] = decisions.get(key)
+        if entry is not None and entry[0] is ref:
+            del decisions[key]
+
+    return callback
+
+
+def _resolve() -> Optional[bool]:
+    """The policy of the module, which accesses a SecureString, None - there is no policy"""
+    decisions: Dict[int, Tuple[Any, Any]] = _decisions
+    frame: Any = sys._getframe(1)
+
+    while frame is not None:
+        code: Any = frame.f_code
+        entry: Optional[Tuple[Any, Any]] = decisions.get(id(code))
+        if entry is not None and entry[0]() is code:
+            decision: Any = entry[1]
+        else:
+            decision = _decide(frame)
+            decisions[id(code)] = (weakref.ref(code, _forget(decisions, id(code))), decision)
+
+        if decision is not _SKIP:
+            return decision
+
+        frame = frame.f_back
+
+    return None  # pragma: no cover
+
+
+def set_module_policy(module: str, protected: Optional[bool]) -> None:
+    """
+    Sets the protection for code of the module and its submodules, when there is no SecureStringContextManager context.
+    The module is found by the frame, which calls a SecureString method; the decision is cached per code object.
+
+    ```py
+    from secure_string import set_module_policy
+
+    set_module_policy('pymysql', False)  # the pure-Python DB driver gets real values
+    set_module_policy('pymysql.err', True)  # the longest module prefix wins
+    ```
+
+    :param protected: None removes the policy
+    """
+    global _decisions
+
+    with _lock:
+        if protected is None:
+            _policies.pop(module, None)
+        else:
+            _policies[module] = bool(protected)
+
+        _decisions = {}
+        SecureStringContextManager._resolver = _resolve if _policies else None
+
+
+def module_policies() -> Dict[str, bool]:
+    """module name -> protection"""
+    return dict(_policies)
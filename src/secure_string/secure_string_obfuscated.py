@@ -0,0 +1,82 @@
+from typing import Optional
+from collections import OrderedDict
+import os
+import threading
+from .secure_string_itself import SecureString
+from .secure_string_keystream import xor_keystream
+
+__all__ = (
+    'SecureStringObfuscated',
+)
+
+
+class SecureStringObfuscated(SecureString):
+    """
+    SecureString that keeps the original value encrypted with a per-process random key,
+    so a heap dump does not contain plaintexts of all secrets at once.
+    The most recently used plaintexts are kept in a small LRU cache.
+
+    ```py
+    from secure_string import SecureStringObfuscated
+
+    password = SecureStringObfuscated('my password')
+    password.value  # 'my password', decrypted on demand
+    ```
+    """
+    _key: bytes = os.urandom(32)
+    """per-process encryption key"""
+    _cache_size: int = 128
+    """the maximum number of cached plaintexts, 0 disables the cache"""
+    _cache: 'OrderedDict[bytes, str]' = OrderedDict()
+    """nonce -> plaintext"""
+    _cache_lock: threading.Lock = threading.Lock()
+    _nonce: bytes = b''
+    _ciphertext: bytes = b''
+
+    @property
+    def _orig_value(self) -> str:
+        self._check_expired()
+        cache: 'OrderedDict[bytes, str]' = SecureStringObfuscated._cache
+        nonce: bytes = self._nonce
+
+        if self._cache_size:
+            with self._cache_lock:
+                plaintext: Optional[str] = cache.get(nonce)
+                if plaintext is not None:
+                    cache.move_to_end(nonce)
+                    return plaintext
+
+        plaintext = xor_keystream(self._key, nonce, self._ciphertext).decode('utf-8')
+
+        if self._cache_size:
+            with self._cache_lock:
+                cache[nonce] = plaintext
+                while len(cache) > self._cache_size:
+                    cache.popitem(last=False)
+
+        return plaintext
+
+    @_orig_value.setter
+    def _orig_value(self, value: str) -> None:
+        self._drop_cached()
+        self._nonce = os.urandom(16)
+        self._ciphertext = xor_keystream(self._key, self._nonce, value.encode('utf-8'))
+
+    def _store_expiring(self, value: str) -> None:
+        self._orig_value = value  # the getter checks the expiry
+
+    def _plaintext_sizeof(self) -> int:
+        return self.__dict__.get('_ciphertext', b'').__sizeof__()
+
+    def _expire(self) -> None:
+        self._drop_cached()
+        super()._expire()
+        self.__dict__.pop('_ciphertext', None)
+
+    def _drop_cached(self) -> None:
+        if self._nonce:
+            with self._cache_lock:
+                SecureStringObfuscated._cache.pop(self._nonce, None)
+
+    def __del__(self) -> None:
+        self._drop_cached()
@@ -0,0 +1,115 @@
+from typing import Any, Dict, Callable
+import threading
+from .secure_string_itself import SecureString
+from .secure_string_patch import patch_attribute, unpatch_attributes
+
+__all__ = (
+    'SecureStringPassthrough',
+    'passthrough',
+)
+
+_BINARY_METHODS = frozenset((
+    '__contains__', '__eq__', '__ge__', '__getitem__', '__gt__', '__le__', '__lt__', '__mod__', '__mul__',
+    '__ne__', '__rmod__', '__rmul__', '__format__',
+))
+"""methods with exactly one argument"""
+
+_FORBIDDEN_METHODS = frozenset(('__getnewargs__', '__reduce__', '__reduce_ex__'))
+"""pickling stays forbidden"""
+
+
+def _build_method(name: str) -> Callable[..., Any]:
+    """a method, that calls the str method with the original value directly"""
+    str_method: Callable[..., Any] = getattr(str, name)
+
+    if name in _BINARY_METHODS:
+        def binary_method(self: SecureString, other: Any) -> Any:
+            # noinspection PyProtectedMember
+            return str_method(self._orig_value, other._orig_value if isinstance(other, SecureString) else other)
+
+        method = binary_method
+    else:
+        def any_method(self: SecureString, *args: Any, **kwargs: Any) -> Any:
+            if args:
+                # noinspection PyProtectedMember
+                args = tuple([(a._orig_value if isinstance(a, SecureString) else a) for a in args])
+            # noinspection PyProtectedMember
+            return str_method(self._orig_value, *args, **kwargs)
+
+        method = any_method
+
+    method.__name__ = name
+    method.__qualname__ = f'SecureString.{name}'
+    return method
+
+
+def _add(self: SecureString, other: Any) -> Any:
+    # noinspection PyProtectedMember
+    return self._orig_value + (other._orig_value if isinstance(other, SecureString) else other)
+
+
+def _radd(self: SecureString, other: Any) -> Any:
+    # noinspection PyProtectedMember
+    return other + self._orig_value
+
+
+def _hash(self: SecureString) -> int:
+    # noinspection PyProtectedMember
+    return self._hash()
+
+
+class SecureStringPassthrough:
+    """
+    Process-wide passthrough specialization for batch jobs, that do not need protection at all.
+
+    Inside the scope methods of SecureString are swapped to direct calls of str methods with original values:
+    no protection, no strict mode, no mode lookups. Wrapped methods are restored on exit.
+    Pickling stays forbidden. Subclasses, that override methods (e.g. `with_policy` classes), keep their methods.
+
+    ```py
+    from secure_string import SecureString, passthrough
+
+    with passthrough():
+        str(SecureString('my password'))  # 'my password' in every thread
+    ```
+    """
+    _lock: threading.Lock = threading.Lock()
+    _depth: int = 0
+    """the number of active scopes, the methods are swapped while it is positive"""
+
+    def __enter__(self) -> 'SecureStringPassthrough':
+        with self._lock:
+            if SecureStringPassthrough._depth == 0:
+                self._install()
+            SecureStringPassthrough._depth += 1
+
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        with self._lock:
+            SecureStringPassthrough._depth -= 1
+            if SecureStringPassthrough._depth == 0:
+                self._restore()
+
+    @classmethod
+    def is_active(cls) -> bool:
+        return cls._depth > 0
+
+    @classmethod
+    def _install(cls) -> None:
+        methods: Dict[str, Any] = {
+            name: _build_method(name) for name in SecureString.policy() if name not in _FORBIDDEN_METHODS
+        }
+        methods.update(__add__=_add, __radd__=_radd, __hash__=_hash)
+
+        for name, method in methods.items():
+            patch_attribute(cls, SecureString, name, method)
+
+    @classmethod
+    def _restore(cls) -> None:
+        unpatch_attributes(cls)  # keeps patches of an enabled profiler, see `secure_string_patch`
+
+
+def passthrough() -> SecureStringPassthrough:
+    """The process-wide passthrough scope, see `SecureStringPassthrough`"""
+    return SecureStringPassthrough()
@@ -0,0 +1,57 @@
+from typing import Any, Dict, List, Tuple
+import threading
+
+__all__ = (
+    'patch_attribute',
+    'unpatch_attributes',
+)
+
+_MISSING = object()
+
+_lock: threading.Lock = threading.Lock()
+_originals: Dict[Tuple[type, str], Any] = {}
+"""(class, attribute name) -> the class attribute before the first active patch, _MISSING if it was inherited"""
+_layers: Dict[Tuple[type, str], List[Tuple[Any, Any]]] = {}
+"""(class, attribute name) -> (owner, value) of active patches in the patch order, the last one is in effect"""
+
+
+def patch_attribute(owner: Any, cls: type, name: str, value: Any) -> None:
+    """
+    Sets a class attribute on behalf of the owner (e.g. a profiler or the passthrough scope),
+    see `unpatch_attributes`
+    """
+    key: Tuple[type, str] = (cls, name)
+
+    with _lock:
+        if key not in _layers:
+            _originals[key] = vars(cls).get(name, _MISSING)
+            _layers[key] = []
+
+        _layers[key].append((owner, value))
+        setattr(cls, name, value)
+
+
+def unpatch_attributes(owner: Any) -> None:
+    """
+    Removes all patches of the owner.
+    An attribute gets the latest patch of another owner or its original value back,
+    so owners, scopes of which overlap without nesting, do not restore patches of each other.
+    """
+    with _lock:
+        for key, layers in list(_layers.items()):
+            remaining: List[Tuple[Any, Any]] = [layer for layer in layers if layer[0] is not owner]
+            if len(remaining) == len(layers):
+                continue
+
+            cls, name = key
+            if remaining:
+                _layers[key] = remaining
+                setattr(cls, name, remaining[-1][1])
+                continue
+
+            del _layers[key]
+            original: Any = _originals.pop(key)
+            if original is _MISSING:
+                delattr(cls, name)
+            else:
+                setattr(cls, name, original)
@@ -0,0 +1,184 @@
+from typing import Optional, Dict, Tuple, List, Any, Type, Iterator
+from functools import wraps
+from types import FunctionType
+from contextlib import contextmanager
+from time import perf_counter_ns
+from global_manager import GlobalManager
+from .secure_string_context import SecureStringContextManager
+from .secure_string_strict_context import SecureStringStrictContextManager
+from .secure_string_itself import SecureString
+from .secure_string_patch import patch_attribute, unpatch_attributes
+
+__all__ = (
+    'SecureStringProfiler',
+    'profile',
+)
+
+_CONTEXT_METHODS: Tuple[str, ...] = ('__enter__', '__exit__', '__aenter__', '__aexit__')
+
+
+def _current_mode() -> str:
+    if SecureStringStrictContextManager.is_strict():
+        return 'strict'
+
+    if SecureStringContextManager.is_protected():
+        return 'protected'
+
+    return 'unprotected'
+
+
+class SecureStringProfiler:
+    """
+    Counts calls and cumulative `perf_counter_ns` time of the wrapped SecureString methods.
+
+    The profiler replaces methods of the SecureString class by measuring wrappers while it is enabled
+    and restores the original methods on disable, thus it costs nothing when it is disabled.
+
+    ```py
+    from secure_string import SecureString, profile
+
+    with profile() as profiler:
+        str(SecureString('my password'))
+
+    profiler.snapshot()
+    # {'methods': {'__str__': {'protected': {'calls': 1, 'total_ns': 2417}}},
+    #  'depth': {'SecureStringContextManager': {'current': 0, 'max': 0}, ...}}
+    ```
+    """
+    _active: Optional['SecureStringProfiler'] = None
+    """currently enabled profiler, only one profiler can be enabled at the same time"""
+
+    def __init__(self, cls: Type[SecureString] = SecureString):
+        self._cls: Type[SecureString] = cls
+        """profiled class"""
+        self._calls: Dict[Tuple[str, str], List[int]] = {}
+        """(method name, mode) -> [calls, total_ns]"""
+        self._depth: Dict[str, List[int]] = {}
+        """context manager name -> [current depth, max depth]"""
+        self._patched: List[Tuple[type, str]] = []
+        """(class, attribute name) of patched attributes, see `secure_string_patch`"""
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._patched)
+
+    def enable(self) -> None:
+        """
+        Start profiling
+
+        :raise RuntimeError: another profiler is already enabled
+        """
+        if self.enabled:
+            return None
+
+        if SecureStringProfiler._active is not None:
+            raise RuntimeError('Another SecureStringProfiler is already enabled')
+
+        for name, attr in list(vars(self._cls).items()):
+            if isinstance(attr, FunctionType) and hasattr(attr, '__wrapped__'):  # decorated methods
+                self._patch(self._cls, name, self._wrap_method(name, attr))
+
+        manager: Type[GlobalManager]
+        for manager in (SecureStringContextManager, SecureStringStrictContextManager):
+            self._depth.setdefault(manager.__name__, [0, 0])
+            for name in _CONTEXT_METHODS:
+                self._patch(manager, name, self._wrap_context_method(manager.__name__, name, getattr(manager, name)))
+
+        SecureStringProfiler._active = self
+        return None
+
+    def disable(self) -> None:
+        """Stop profiling, collected data remains available through `snapshot`"""
+        unpatch_attributes(self)
+        self._patched.clear()
+
+        if SecureStringProfiler._active is self:
+            SecureStringProfiler._active = None
+
+    def reset(self) -> None:
+        """Forget collected data"""
+        self._calls.clear()
+        for depth in self._depth.values():
+            depth[1] = depth[0]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Collected data as a plain dict
+
+        :return: {'methods': {method: {mode: {'calls': int, 'total_ns': int}}},
+                  'depth': {context manager: {'current': int, 'max': int}}}
+        """
+        methods: Dict[str, Dict[str, Dict[str, int]]] = {}
+        for (name, mode), (calls, total_ns) in self._calls.items():
+            methods.setdefault(name, {})[mode] = {'calls': calls, 'total_ns': total_ns}
+
+        return {
+            'methods': methods,
+            'depth': {name: {'current': current, 'max': max_} for name, (current, max_) in self._depth.items()},
+        }
+
+    def _patch(self, cls: type, name: str, value: Any) -> None:
+        self._patched.append((cls, name))
+        patch_attribute(self, cls, name, value)
+
+    def _wrap_method(self, name: str, func):
+        calls: Dict[Tuple[str, str], List[int]] = self._calls
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any):
+            mode: str = _current_mode()
+            start: int = perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed: int = perf_counter_ns() - start
+                entry: Optional[List[int]] = calls.get((name, mode))
+                if entry is None:
+                    entry = calls[(name, mode)] = [0, 0]
+                entry[0] += 1
+                entry[1] += elapsed
+
+        return wrapper
+
+    def _wrap_context_method(self, manager_name: str, name: str, func):
+        depth: List[int] = self._depth[manager_name]
+        step: int = 1 if name in ('__enter__', '__aenter__') else -1
+
+        def _count() -> None:
+            depth[0] = max(depth[0] + step, 0)
+            if depth[0] > depth[1]:
+                depth[1] = depth[0]
+
+        if name.startswith('__a'):
+            sync_name: str = name.replace('__a', '__', 1)
+
+            # not the original coroutine: it calls the sync method in global-manager 1.0.3, which is counted too
+            @wraps(func)
+            async def async_wrapper(self: Any, *args: Any, **kwargs: Any):
+                return getattr(self, sync_name)(*args, **kwargs)
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any):
+            _count()
+            return func(*args, **kwargs)
+
+        return wrapper
+
+
+@contextmanager
+def profile(profiler: Optional[SecureStringProfiler] = None) -> Iterator[SecureStringProfiler]:
+    """
+    Enables a SecureStringProfiler for the duration of the `with` block
+
+    :param profiler: a profiler to continue collecting into, a new one by default
+    """
+    if profiler is None:
+        profiler = SecureStringProfiler()
+
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
@@ -0,0 +1,89 @@
+from typing import Dict, Any, Optional
+import threading
+import weakref
+from .secure_string_itself import SecureString
+
+__all__ = (
+    'SecureStringRegistry',
+    'stats',
+    'track',
+)
+
+
+class SecureStringRegistry:
+    """
+    Weak references to live SecureStrings, created while tracking is enabled.
+
+    Tracking installs `SecureString.__init__`, so it costs nothing when it is disabled.
+    """
+    def __init__(self) -> None:
+        self._refs: Dict[int, Any] = {}
+        """id -> weak reference to a SecureString"""
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._refs)
+
+    def register(self, secure_string: SecureString) -> None:
+        key: int = id(secure_string)
+        refs: Dict[int, Any] = self._refs
+
+        def remove(_ref: Any) -> None:
+            refs.pop(key, None)
+
+        with self._lock:
+            refs[key] = weakref.ref(secure_string, remove)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Statistics of live SecureStrings, without values
+
+        :return: {'count': int, 'plaintext_object_bytes': int,
+                  'types': {qualified class name: {'count', 'plaintext_object_bytes'}}},
+            where `plaintext_object_bytes` is `sys.getsizeof` of the objects keeping original values, headers included:
+            str objects of SecureString, ciphertexts of SecureStringObfuscated, joined values of SecureStringRope
+            (0 until a rope is joined); it is not the length of the plaintexts
+        """
+        with self._lock:
+            refs = list(self._refs.values())
+
+        result: Dict[str, Any] = {'count': 0, 'plaintext_object_bytes': 0, 'types': {}}
+        for ref in refs:
+            secure_string: Optional[SecureString] = ref()
+            if secure_string is None:
+                continue
+
+            cls = type(secure_string)
+            type_stats: Dict[str, int] = result['types'].setdefault(
+                f'{cls.__module__}.{cls.__qualname__}', {'count': 0, 'plaintext_object_bytes': 0},
+            )
+            # noinspection PyProtectedMember
+            size: int = secure_string._plaintext_sizeof()
+            type_stats['count'] += 1
+            type_stats['plaintext_object_bytes'] += size
+            result['count'] += 1
+            result['plaintext_object_bytes'] += size
+
+        return result
+
+
+_registry: SecureStringRegistry = SecureStringRegistry()
+
+
+def _registering_init(self: SecureString, *args: Any, **kwargs: Any) -> None:
+    _registry.register(self)
+
+
+def track(enabled: bool = True) -> None:
+    """
+    Enables or disables tracking of live SecureStrings, SecureStrings created before are not tracked.
+    """
+    if enabled:
+        setattr(SecureString, '__init__', _registering_init)
+    elif '__init__' in vars(SecureString):
+        delattr(SecureString, '__init__')
+
+
+def stats() -> Dict[str, Any]:
+    """Statistics of tracked live SecureStrings, see `SecureStringRegistry.stats`"""
+    return _registry.stats()
@@ -0,0 +1,105 @@
+from typing import Callable, List, Tuple, Type, Union
+import threading
+from .secure_string_itself import SecureString
+
+__all__ = (
+    'RotatingSecureString',
+)
+
+_Callback = Callable[[SecureString, int], None]
+
+
+class RotatingSecureString:
+    """
+    A handle of a rotatable secret.
+
+    Readers get a consistent (version, SecureString) snapshot by one attribute read, without locks.
+    Writers are serialized, callbacks are called after each rotation in the rotation order.
+
+    ```py
+    from secure_string import RotatingSecureString
+
+    password = RotatingSecureString('old password')
+    password.subscribe(lambda current, version: pool.reconnect())
+    password.rotate('new password')
+    password.current.value  # 'new password'
+    password.version  # 1
+    ```
+    """
+    def __init__(self, value: Union[str, SecureString], secure_string_class: Type[SecureString] = SecureString):
+        self._secure_string_class: Type[SecureString] = secure_string_class
+        self._state: Tuple[int, SecureString] = (0, self._wrap(value))
+        """(version, current value), replaced as a whole"""
+        self._lock: threading.Lock = threading.Lock()
+        """guards `_state` and `_callbacks`, never held while callbacks run"""
+        self._rotate_lock: threading.Lock = threading.Lock()
+        """serializes writers, so callbacks are called in the rotation order"""
+        self._callbacks: List[_Callback] = []
+
+    def _wrap(self, value: Union[str, SecureString]) -> SecureString:
+        if isinstance(value, SecureString):
+            return value
+
+        return self._secure_string_class(value)
+
+    @property
+    def current(self) -> SecureString:
+        return self._state[1]
+
+    @property
+    def version(self) -> int:
+        return self._state[0]
+
+    @property
+    def value(self) -> str:
+        """the real current value, see `SecureString.value`"""
+        return self._state[1].value
+
+    def snapshot(self) -> Tuple[int, SecureString]:
+        """(version, current value) of the same rotation"""
+        return self._state
+
+    def rotate(self, value: Union[str, SecureString]) -> int:
+        """
+        Replaces the current value.
+        Callbacks may subscribe and unsubscribe, but must not rotate the same handle.
+
+        :return: the new version
+        """
+        secure_string: SecureString = self._wrap(value)
+
+        with self._rotate_lock:
+            with self._lock:
+                version: int = self._state[0] + 1
+                self._state = (version, secure_string)
+                callbacks: List[_Callback] = list(self._callbacks)
+
+            for callback in callbacks:
+                callback(secure_string, version)
+
+        return version
+
+    def subscribe(self, callback: _Callback) -> Callable[[], None]:
+        """
+        Calls `callback(current value, version)` after each rotation
+
+        :return: unsubscribe function
+        """
+        with self._lock:
+            self._callbacks.append(callback)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if callback in self._callbacks:
+                    self._callbacks.remove(callback)
+
+        return unsubscribe
+
+    def __str__(self) -> str:
+        return str(self._state[1])
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self._state[1]!r}, version={self._state[0]})'
+
+    def __format__(self, format_spec: str) -> str:
+        return format(self._state[1], format_spec)
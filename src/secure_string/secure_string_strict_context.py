@@ -1,18 +1,47 @@
-from typing import Optional
+from typing import Optional, Dict, Tuple, Any, Callable, TypeVar
 from functools import wraps
+from random import random
+import os
+import sys
+import threading
 from global_manager import GlobalManager
+from .secure_string_context import _scoped
 from .secure_string_strict_exceptions import SecureStringStrictError
 
 __all__ = (
     'SecureStringStrictContextManager',
     'SecureStringStrictDecorator',
+    'SecureStringStrictRecorder',
+    'SecureStringStrictRecordContextManager',
+    'strict',
 )
 
+_F = TypeVar('_F', bound=Callable[..., Any])
+
+_PACKAGE_DIR: str = os.path.dirname(os.path.abspath(__file__))
+
+_audit: Optional[Callable[..., None]] = getattr(sys, 'audit', None)  # python 3.8+
+
+_recording: int = 0
+"""the number of active recorder sources (contexts, the process-wide recorder, the control channel),
+the strict decorator looks a recorder up only when it is not 0"""
+_recording_lock: threading.Lock = threading.Lock()
+
+
+def _add_recording(delta: int) -> None:
+    global _recording
+
+    with _recording_lock:
+        _recording += delta
+
 
 class SecureStringStrictContextManager(GlobalManager[bool]):
     """
     In the strict mode
     """
+    _channel: Optional[Any] = None
+    """the installed SecureStringControlChannel, its flags are the defaults when there is no context"""
+
     @classmethod
     def is_strict(cls) -> bool:
         """
@@ -22,12 +51,135 @@ class SecureStringStrictContextManager(GlobalManager[bool]):
         """
         is_strict: Optional[bool] = super().get_current_context()
 
+        if is_strict is None and cls._channel is not None:
+            return cls._channel.strict
+
         if is_strict:
             return True
 
         return False
 
 
+class SecureStringStrictRecorder:
+    """
+    Record-only strict mode.
+    Instead of raising SecureStringStrictError, counts call sites of implicit accesses to SecureString instances.
+
+    ```py
+    from secure_string import SecureString, SecureStringStrictRecorder, SecureStringStrictRecordContextManager
+
+    recorder = SecureStringStrictRecorder(sample_rate=0.01)
+
+    with SecureStringStrictRecordContextManager(recorder):
+        print(SecureString('my password'))
+
+    recorder.sites()  # {('/app/main.py', 7, '<module>', '__str__'): 1}
+    ```
+    """
+    AUDIT_EVENT: str = 'secure_string.implicit_access'
+    """name of `sys.audit` event, arguments are (method name, filename, line number)"""
+
+    def __init__(self, sample_rate: float = 1.0, max_sites: int = 1024, audit: bool = False):
+        if not 0.0 < sample_rate <= 1.0:
+            raise ValueError(f'sample_rate must be in (0, 1], got {sample_rate}')
+
+        self._sample_rate: float = sample_rate
+        """the probability to record an implicit access"""
+        self._max_sites: int = max_sites
+        """the maximum number of different call sites to remember"""
+        self._audit: Optional[Callable[..., None]] = _audit if audit else None
+        """`sys.audit` if events have to be emitted"""
+        self._sites: Dict[Tuple[str, int, str, str], int] = {}
+        """(filename, line number, function, method name) -> count"""
+        self._dropped: int = 0
+        """the number of recorded accesses from call sites that did not fit into `max_sites`"""
+
+    def record(self, method_name: str) -> None:
+        """Records the call site of an implicit access via the method of SecureString"""
+        if self._sample_rate < 1.0 and random() >= self._sample_rate:
+            return None
+
+        frame: Any = sys._getframe(1)
+        while frame is not None and frame.f_code.co_filename.startswith(_PACKAGE_DIR):
+            frame = frame.f_back
+
+        if frame is None:  # pragma: no cover
+            return None
+
+        code = frame.f_code
+        key: Tuple[str, int, str, str] = (code.co_filename, frame.f_lineno, code.co_name, method_name)
+        count: Optional[int] = self._sites.get(key)
+
+        if count is not None:
+            self._sites[key] = count + 1
+        elif len(self._sites) < self._max_sites:
+            self._sites[key] = 1
+        else:
+            self._dropped += 1
+
+        if self._audit is not None:
+            self._audit(self.AUDIT_EVENT, method_name, code.co_filename, frame.f_lineno)
+
+        return None
+
+    def sites(self) -> Dict[Tuple[str, int, str, str], int]:
+        """(filename, line number, function, method name) -> count of recorded accesses"""
+        return dict(self._sites)
+
+    @property
+    def dropped(self) -> int:
+        """the number of recorded accesses from call sites that did not fit into `max_sites`"""
+        return self._dropped
+
+    def reset(self) -> None:
+        self._sites.clear()
+        self._dropped = 0
+
+
+class SecureStringStrictRecordContextManager(GlobalManager[SecureStringStrictRecorder]):
+    """
+    Enables the record-only strict mode in the context.
+    Use `install` to enable it for the whole process, e.g. in production.
+    """
+    _default: Optional[SecureStringStrictRecorder] = None
+    """the process-wide recorder, used when there is no recorder in the current context"""
+
+    @classmethod
+    def get_recorder(cls) -> Optional[SecureStringStrictRecorder]:
+        """The recorder of the current context, the recorder of the control channel, the process-wide recorder or None"""
+        recorder: Optional[SecureStringStrictRecorder] = super().get_current_context()
+
+        if recorder is None:
+            channel: Optional[Any] = SecureStringStrictContextManager._channel
+            if channel is not None and channel.record:
+                return channel.recorder
+
+            return cls._default
+
+        return recorder
+
+    def __enter__(self):
+        _add_recording(1)
+        return super().__enter__()
+
+    async def __aenter__(self):
+        # not super().__aenter__: it calls __enter__ in global-manager 1.0.3
+        return self.__enter__()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        super().__exit__(exc_type, exc_val, exc_tb)
+        _add_recording(-1)
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.__exit__(exc_type, exc_val, exc_tb)
+
+    @classmethod
+    def install(cls, recorder: Optional[SecureStringStrictRecorder]) -> None:
+        """Sets the process-wide recorder, None disables the process-wide record-only strict mode"""
+        _add_recording((recorder is not None) - (cls._default is not None))
+        cls._default = recorder
+
+
 class SecureStringStrictDecorator:
     """
     Decorator for disallow a decorated method in strict mode context
@@ -37,6 +189,25 @@ class SecureStringStrictDecorator:
         def wrapper(*args, **kwargs):
             if SecureStringStrictContextManager.is_strict():
                 raise SecureStringStrictError(f'Method "{func.__name__}" does not allowed in strict mode context')
+
+            if _recording:
+                recorder: Optional[SecureStringStrictRecorder] = SecureStringStrictRecordContextManager.get_recorder()
+                if recorder is not None:
+                    recorder.record(func.__name__)
+
             return func(*args, **kwargs)
 
         return wrapper
+
+
+def strict(func: _F) -> _F:
+    """
+    Calls of the decorated function (or coroutine function) work in `SecureStringStrictContextManager(True)`
+
+    ```py
+    @strict
+    def handle(request: Request) -> Response:
+        ...  # implicit accesses to SecureString raise SecureStringStrictError
+    ```
+    """
+    return _scoped(SecureStringStrictContextManager, True, func)
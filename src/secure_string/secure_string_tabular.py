@@ -0,0 +1,195 @@
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple, Type, Union
+from concurrent.futures import ProcessPoolExecutor
+import csv
+import itertools
+import os
+import pickle
+import shutil
+from .secure_string_itself import SecureString
+from .secure_string_mask import SecureStringFixedMask
+
+__all__ = (
+    'iter_secure_rows',
+    'mask_csv',
+)
+
+_PathType = Union[str, 'os.PathLike[str]']
+
+CHUNK_ROWS: int = 10_000
+"""rows are masked and written by chunks"""
+
+
+def _column_indexes(header: Sequence[str], columns: Iterable[str]) -> List[int]:
+    """
+    :raise ValueError: a column is not in the header
+    """
+    indexes: List[int] = []
+    for column in columns:
+        if column not in header:
+            raise ValueError(f'Column "{column}" is not in the header')
+        indexes.append(header.index(column))
+    return indexes
+
+
+def _mask_rows(rows: Iterable[List[str]], indexes: List[int], mask: Callable[[str], str]) -> Iterator[List[str]]:
+    for row in rows:
+        for index in indexes:
+            if index < len(row):
+                row[index] = mask(row[index])
+        yield row
+
+
+def _write_chunks(writer: Any, rows: Iterator[List[str]]) -> int:
+    count: int = 0
+    while True:
+        chunk: List[List[str]] = list(itertools.islice(rows, CHUNK_ROWS))
+        if not chunk:
+            return count
+        writer.writerows(chunk)
+        count += len(chunk)
+
+
+def iter_secure_rows(
+    file: TextIO,
+    columns: Iterable[str],
+    *,
+    delimiter: str = ',',
+    secure_string_class: Type[SecureString] = SecureString,
+) -> Iterator[List[Union[str, SecureString]]]:
+    """
+    Streams rows of CSV/TSV with the header, values of `columns` are wrapped into SecureString
+
+    :param file: a file opened with `newline=''`
+    :raise ValueError: a column is not in the header
+    """
+    reader = csv.reader(file, delimiter=delimiter)
+    header: List[str] = next(reader, [])
+    indexes: List[int] = _column_indexes(header, columns)
+    yield list(header)
+
+    for row in reader:
+        secure_row: List[Union[str, SecureString]] = list(row)
+        for index in indexes:
+            if index < len(row):
+                secure_row[index] = secure_string_class(row[index])
+        yield secure_row
+
+
+def _mask_range(
+    src: str, part: str, start: int, end: int, indexes: List[int], mask: Callable[[str], str], delimiter: str,
+    encoding: str,
+) -> int:
+    """masks rows between byte offsets into the part file, runs in a worker process"""
+    def lines() -> Iterator[str]:
+        with open(src, 'rb') as f:
+            f.seek(start)
+            while f.tell() < end:
+                line: bytes = f.readline()
+                if not line:
+                    return
+                yield line.decode(encoding)
+
+    with open(part, 'w', encoding=encoding, newline='') as dst:
+        return _write_chunks(
+            csv.writer(dst, delimiter=delimiter),
+            _mask_rows(csv.reader(lines(), delimiter=delimiter), indexes, mask),
+        )
+
+
+def _split(src: str, start: int, parts: int) -> List[Tuple[int, int]]:
+    """byte ranges of whole lines"""
+    size: int = os.path.getsize(src)
+    offsets: List[int] = [start]
+
+    with open(src, 'rb') as f:
+        for i in range(1, parts):
+            f.seek(max(start + (size - start) * i // parts - 1, offsets[-1]))
+            f.readline()  # to the beginning of the next line
+            offsets.append(max(f.tell(), offsets[-1]))
+
+    offsets.append(size)
+    return [(begin, end) for begin, end in zip(offsets, offsets[1:]) if begin < end]
+
+
+def mask_csv(
+    src: _PathType,
+    dst: _PathType,
+    columns: Iterable[str],
+    *,
+    mask: Optional[Callable[[str], str]] = None,
+    delimiter: str = ',',
+    encoding: str = 'utf-8',
+    workers: Optional[int] = None,
+) -> int:
+    """
+    Copies CSV/TSV with masked values of secret columns, memory usage does not depend on the file size.
+
+    With `workers` the file is split by byte ranges, which are masked in a process pool.
+    In this case quoted values must not contain line breaks, and the mask must be picklable
+    (a mask class instance or a module-level function, not a lambda or a local function).
+
+    ```py
+    from secure_string import mask_csv, SecureStringFingerprintMask
+
+    mask_csv('users.csv', 'users.masked.csv', ['password_hash', 'api_key'], mask=SecureStringFingerprintMask())
+    ```
+
+    :param columns: names of secret columns
+    :param mask: a mask, see `secure_string_mask`, `SecureStringFixedMask()` by default
+    :param workers: the number of worker processes
+    :return: the number of masked rows
+    :raise ValueError: a column is not in the header
+    :raise TypeError: the mask cannot be sent to worker processes
+    """
+    if mask is None:
+        mask = SecureStringFixedMask()
+
+    if workers and workers >= 2:
+        try:
+            pickle.dumps(mask)
+        except (pickle.PicklingError, AttributeError, TypeError) as e:
+            name: str = getattr(mask, '__qualname__', type(mask).__qualname__)
+            raise TypeError(f'mask must be picklable to be used with workers, {name} is not: {e}') from e
+
+    src, dst = os.fspath(src), os.fspath(dst)
+
+    with open(src, encoding=encoding, newline='') as src_file, open(dst, 'w', encoding=encoding, newline='') as dst_file:
+        reader = csv.reader(src_file, delimiter=delimiter)
+        writer = csv.writer(dst_file, delimiter=delimiter)
+        header: List[str] = next(reader, [])
+        indexes: List[int] = _column_indexes(header, columns)
+        writer.writerow(header)
+
+        if not workers or workers < 2:
+            return _write_chunks(writer, _mask_rows(reader, indexes, mask))
+
+    with open(src, 'rb') as f:
+        f.readline()  # the header
+        data_start: int = f.tell()
+
+    ranges: List[Tuple[int, int]] = _split(src, data_start, workers)
+    if not ranges:
+        return 0
+
+    part_paths: List[str] = [f'{dst}.part{i}' for i in range(len(ranges))]
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            counts = list(executor.map(
+                _mask_range,
+                *zip(*[
+                    (src, part, start, end, indexes, mask, delimiter, encoding)
+                    for part, (start, end) in zip(part_paths, ranges)
+                ]),
+            ))
+
+        with open(dst, 'ab') as dst_bytes:
+            for part in part_paths:
+                with open(part, 'rb') as part_file:
+                    shutil.copyfileobj(part_file, dst_bytes)
+    finally:
+        for part in part_paths:
+            if os.path.exists(part):
+                os.remove(part)
+
+    return sum(counts)
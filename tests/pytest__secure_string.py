@@ -0,0 +1,45 @@
+import subprocess
+import sys
+import pytest
+import secure_string as tm
+
+IMPORT_TIME_BUDGET_US: int = 50_000
+"""the budget of self import time of the secure_string modules, microseconds"""
+
+
+def _import_times() -> dict:
+    """module name -> self import time (us) of `import secure_string`"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import secure_string'],
+        capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _cumulative_us, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(self_us)
+    return times
+
+
+def test_import_time():
+    times = _import_times()
+    assert 'secure_string' in times
+    assert 'secure_string.secure_string_profile' not in times  # lazy
+    assert sum(us for name, us in times.items() if name.split('.')[0] == 'secure_string') < IMPORT_TIME_BUDGET_US
+
+
+def test_version():
+    from importlib.metadata import version
+    assert tm.__version__ == version('secure_strings')
+
+
+def test_lazy_attributes():
+    from secure_string import profile, SecureStringProfiler
+    from secure_string.secure_string_profile import profile as profile_
+    assert profile is profile_
+    assert tm.SecureStringProfiler is SecureStringProfiler
+    assert {'profile', 'SecureStringProfiler', '__version__', 'SecureString'} <= set(dir(tm))
+
+    with pytest.raises(AttributeError, match='does_not_exist'):
+        _r = tm.does_not_exist
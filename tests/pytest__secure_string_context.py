@@ -0,0 +1,89 @@
+import asyncio
+import contextvars
+import pytest
+import secure_string.secure_string_context as tm
+from secure_string import SecureString
+
+
+class TestUnprotected:
+    def test_unprotected(self):
+        ss = SecureString('my password')
+
+        @tm.unprotected
+        def reveal(value):
+            """docstring"""
+            return str(value)
+
+        assert reveal(ss) == 'my password'
+        assert reveal.__doc__ == 'docstring'
+        assert str(ss) == '***'
+
+        with tm.SecureStringContextManager(False):
+            assert reveal(ss) == 'my password'
+            assert tm.SecureStringContextManager.is_protected() is False
+
+    def test_nested_and_errors(self):
+        @tm.unprotected
+        def fail():
+            raise RuntimeError
+
+        with tm.SecureStringContextManager(True):
+            with pytest.raises(RuntimeError):
+                fail()
+            assert tm.SecureStringContextManager.is_protected() is True
+
+        @tm.unprotected
+        def nested(depth):
+            if depth:
+                return nested(depth - 1)
+            return tm.SecureStringContextManager.is_protected()
+
+        assert nested(10) is False
+        assert tm.SecureStringContextManager.is_protected() is True
+
+    def test_async(self):
+        ss = SecureString('my password')
+
+        @tm.unprotected
+        async def reveal(value):
+            await asyncio.sleep(0)
+            return str(value)
+
+        async def main():
+            return await asyncio.gather(reveal(ss), reveal(ss)), str(ss)
+
+        assert asyncio.run(main()) == (['my password', 'my password'], '***')
+
+    def test_generator(self):
+        with pytest.raises(TypeError):
+            @tm.unprotected
+            def generator():
+                yield 1
+
+    def test_storage_contract(self):
+        """the fast path relies on the ContextVar of global-manager 1.0.3/1.0.4"""
+        storage = tm._get_storage(tm.SecureStringContextManager)
+        assert isinstance(storage, contextvars.ContextVar)
+        assert storage is tm.SecureStringContextManager._storage
+
+        token = storage.set(False)
+        try:
+            assert tm.SecureStringContextManager.is_protected() is False
+        finally:
+            storage.reset(token)
+
+    def test_public_api_fallback(self, monkeypatch):
+        monkeypatch.setattr(tm, '_get_storage', lambda manager: None)
+        ss = SecureString('my password')
+
+        @tm.unprotected
+        def reveal(value):
+            return str(value)
+
+        @tm.unprotected
+        async def reveal_async(value):
+            return str(value)
+
+        assert reveal(ss) == 'my password'
+        assert asyncio.run(reveal_async(ss)) == 'my password'
+        assert str(ss) == '***'
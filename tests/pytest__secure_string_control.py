@@ -0,0 +1,87 @@
+import os
+import signal
+import pytest
+import secure_string.secure_string_control as tm
+from secure_string import SecureString, SecureStringStrictContextManager, SecureStringStrictRecordContextManager
+from secure_string.secure_string_strict_exceptions import SecureStringStrictError
+
+
+def _recording_sources():
+    from secure_string import secure_string_strict_context
+    return secure_string_strict_context._recording
+
+
+class TestSecureStringControlChannel:
+    def test_shared_flags(self, tmp_path):
+        path = str(tmp_path / 'flags')
+        with tm.SecureStringControlChannel(path) as first, tm.SecureStringControlChannel(path) as second:
+            assert first.flags == 0
+            first.record = True
+            assert second.record is True
+            assert second.strict is False
+            second.strict = True
+            assert first.flags == tm.SecureStringControlChannel.RECORD | tm.SecureStringControlChannel.STRICT
+            first.record = False
+            assert second.flags == tm.SecureStringControlChannel.STRICT
+
+        with tm.SecureStringControlChannel(path) as third:  # the flags survive
+            assert third.strict is True
+
+    def test_one_byte_per_flag(self, tmp_path):
+        path = tmp_path / 'flags'
+        with tm.SecureStringControlChannel(str(path)) as channel:
+            channel.strict = True
+            assert path.read_bytes() == b'\x00\x01'
+            channel.record = True
+            channel.strict = False
+            assert path.read_bytes() == b'\x01\x00'
+
+    def test_install(self, tmp_path):
+        ss = SecureString('my password')
+        with tm.SecureStringControlChannel(str(tmp_path / 'flags')) as channel:
+            channel.install(signals=False)
+
+            str(ss)
+            assert channel.recorder.sites() == {}
+
+            channel.record = True
+            str(ss)
+            assert len(channel.recorder.sites()) == 1
+            assert SecureStringStrictRecordContextManager.get_recorder() is channel.recorder
+
+            channel.strict = True
+            with pytest.raises(SecureStringStrictError):
+                str(ss)
+            with SecureStringStrictContextManager(False):  # a context wins
+                str(ss)
+
+            channel.install(signals=False)  # idempotent
+            assert _recording_sources() == 1
+
+            channel.uninstall()
+            assert _recording_sources() == 0
+            assert SecureStringStrictContextManager.is_strict() is False
+            assert SecureStringStrictRecordContextManager.get_recorder() is None
+
+    @pytest.mark.skipif(not hasattr(signal, 'SIGUSR1'), reason='no SIGUSR1')
+    def test_signals(self, tmp_path):
+        previous = signal.getsignal(signal.SIGUSR1)
+        with tm.SecureStringControlChannel(str(tmp_path / 'flags')) as channel:
+            channel.install()
+            os.kill(os.getpid(), signal.SIGUSR1)
+            assert channel.record is True
+            os.kill(os.getpid(), signal.SIGUSR2)
+            assert channel.record is False
+
+        assert signal.getsignal(signal.SIGUSR1) is previous
+
+    @pytest.mark.skipif(not hasattr(signal, 'SIGUSR1'), reason='no SIGUSR1')
+    def test_signals_install_twice(self, tmp_path):
+        previous = signal.getsignal(signal.SIGUSR1), signal.getsignal(signal.SIGUSR2)
+        with tm.SecureStringControlChannel(str(tmp_path / 'flags')) as channel:
+            channel.install()
+            channel.install()
+            os.kill(os.getpid(), signal.SIGUSR1)
+            assert channel.record is True
+
+        assert (signal.getsignal(signal.SIGUSR1), signal.getsignal(signal.SIGUSR2)) == previous
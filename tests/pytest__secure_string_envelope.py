@@ -0,0 +1,85 @@
+import pytest
+from secure_string import SecureString
+from secure_string.secure_string_exceptions import SecureStringEnvelopeError
+import secure_string.secure_string_envelope as tm
+
+
+class TestSecureStringEnvelope:
+    def test_roundtrip(self, tmp_path):
+        path = tmp_path / 'secrets.env'
+        secrets = {f'name{i}': f'value{i}' for i in range(100)}
+        secrets['password'] = SecureString('my password')
+        tm.write_envelope(path, b'local key', secrets)
+
+        assert b'my password' not in path.read_bytes()
+
+        with tm.SecureStringEnvelope(path, SecureString('local key')) as envelope:
+            assert len(envelope) == 101
+            assert isinstance(envelope['password'], SecureString)
+            assert envelope['password'].value == 'my password'
+            assert all(envelope[f'name{i}'].value == f'value{i}' for i in range(100))
+            assert 'name1' in envelope
+            assert 'missing' not in envelope
+            assert envelope.get('missing') is None
+            with pytest.raises(KeyError):
+                envelope['missing']
+
+    def test_empty(self, tmp_path):
+        path = tmp_path / 'secrets.env'
+        tm.write_envelope(path, 'local key', {})
+        with tm.SecureStringEnvelope(path, 'local key') as envelope:
+            assert len(envelope) == 0
+            assert envelope.get('name') is None
+
+    def test_replace(self, tmp_path):
+        path = tmp_path / 'secrets.env'
+        tm.write_envelope(path, b'local key', {'name': 'old'})
+        tm.write_envelope(path, b'local key', {'name': 'new'})
+        with tm.SecureStringEnvelope(path, b'local key') as envelope:
+            assert envelope['name'].value == 'new'
+        assert [p.name for p in tmp_path.iterdir()] == ['secrets.env']
+
+    def test_wrong_key(self, tmp_path):
+        path = tmp_path / 'secrets.env'
+        tm.write_envelope(path, b'local key', {'name': 'value'})
+        with pytest.raises(SecureStringEnvelopeError):
+            tm.SecureStringEnvelope(path, b'another key')
+
+    def test_tampered(self, tmp_path):
+        path = tmp_path / 'secrets.env'
+        tm.write_envelope(path, b'local key', {'name': 'value'})
+        data = bytearray(path.read_bytes())
+        data[-40] ^= 1
+        path.write_bytes(bytes(data))
+
+        with tm.SecureStringEnvelope(path, b'local key') as envelope:
+            with pytest.raises(SecureStringEnvelopeError):
+                envelope['name']
+
+        path.write_bytes(b'not an envelope')
+        with pytest.raises(SecureStringEnvelopeError):
+            tm.SecureStringEnvelope(path, b'local key')
+
+        path.write_bytes(b'')
+        with pytest.raises(SecureStringEnvelopeError):
+            tm.SecureStringEnvelope(path, b'local key')
+
+    def test_tampered_collision(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(tm, '_name_digest', lambda mac_key, name: b'\0' * 8)  # every name collides
+        path = tmp_path / 'secrets.env'
+        tm.write_envelope(path, b'local key', {'a': 'value a', 'b': 'value b'})
+
+        with tm.SecureStringEnvelope(path, b'local key') as envelope:
+            assert envelope['a'].value == 'value a'
+            assert envelope['b'].value == 'value b'
+            with pytest.raises(SecureStringEnvelopeError):
+                envelope['missing']  # every record with the digest fails
+
+        data = bytearray(path.read_bytes())
+        data[tm._HEADER.size + 2 * tm._ENTRY.size + tm._MAC_SIZE + tm._NONCE_SIZE] ^= 1  # the record of 'a'
+        path.write_bytes(bytes(data))
+
+        with tm.SecureStringEnvelope(path, b'local key') as envelope:
+            assert envelope['b'].value == 'value b'
+            with pytest.raises(SecureStringEnvelopeError):
+                envelope.get('a')
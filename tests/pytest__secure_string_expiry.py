@@ -0,0 +1,102 @@
+import copy
+import time
+import datetime
+import pytest
+import secure_string.secure_string_expiry as tm
+from secure_string import SecureString, SecureStringContextManager
+from secure_string.secure_string_exceptions import SecureStringExpiredError
+
+
+class TestSecureStringExpiry:
+    def test_not_expiring(self):
+        ss = SecureString('hello')
+        assert not ss.expired
+        assert ss.value == 'hello'
+
+    def test_ttl(self):
+        ss = SecureString('hello', ttl=60)
+        assert not ss.expired
+        assert ss.value == 'hello'
+
+        expired = SecureString('hello', ttl=-1)
+        assert expired.expired
+        with pytest.raises(SecureStringExpiredError):
+            _r = expired.value
+
+    def test_expires_at(self):
+        assert SecureString('hello', expires_at=time.time() - 1).expired
+        assert not SecureString('hello', expires_at=time.time() + 60).expired
+        assert SecureString('hello', expires_at=datetime.datetime.now() - datetime.timedelta(seconds=1)).expired
+        assert SecureString('hello', ttl=60, expires_at=time.time() - 1).expired
+
+    def test_sweeper_thread(self):
+        ss = SecureString('hello', ttl=0.01)
+        deadline = time.monotonic() + 5
+        while '_expiring_value' in ss.__dict__ and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert '_expiring_value' not in ss.__dict__
+        with SecureStringContextManager(False):
+            with pytest.raises(SecureStringExpiredError):
+                str(ss)
+
+    def test_unswept_reads(self):
+        """reads between the deadline and the sweep raise too"""
+        ss = SecureString('hello', ttl=-1)
+        with SecureStringContextManager(False):
+            with pytest.raises(SecureStringExpiredError):
+                str(ss)
+            with pytest.raises(SecureStringExpiredError):
+                _r = f'{ss}'
+
+        from secure_string import reveal
+        with pytest.raises(SecureStringExpiredError):
+            reveal({'password': ss})
+
+    def test_stable_hash(self):
+        ss = SecureString('hello', ttl=60)
+        keys = {ss: 1}
+        ss._expire()
+        assert ss.expired
+        assert keys[ss] == 1
+
+        with pytest.raises(SecureStringExpiredError):
+            hash(SecureString('hello', ttl=-1))
+
+    def test_expire_without_deadline(self):
+        ss = SecureString('hello')
+        ss._expire()
+        assert ss.expired
+        with pytest.raises(SecureStringExpiredError):
+            _r = ss.value
+
+    def test_copy(self):
+        ss = SecureString('hello', ttl=60)
+        assert copy.copy(ss)._expires_at == pytest.approx(ss._expires_at, abs=1)
+        expired = SecureString('hello', ttl=-1)
+        assert copy.deepcopy(expired) is expired
+
+
+class TestSecureStringSweeper:
+    def test_sweep(self):
+        sweeper = tm.SecureStringSweeper()
+        now = time.monotonic() + 1000  # far from the sweeper thread
+        strings = [SecureString(f'hello {i}') for i in range(100)]
+        for i, ss in reversed(list(enumerate(strings))):
+            sweeper.schedule(ss, now + i)
+
+        assert len(sweeper) == 100
+        assert sweeper.sweep(now + 9.5) == 10
+        assert len(sweeper) == 90
+        assert all('_orig_value' not in ss.__dict__ for ss in strings[:10])
+        assert all('_orig_value' in ss.__dict__ for ss in strings[10:])
+        assert all(ss.expired for ss in strings[:10])
+
+    def test_dead_references(self):
+        sweeper = tm.SecureStringSweeper()
+        sweeper.schedule(SecureString('hello'), time.monotonic() + 1000)
+        assert sweeper.sweep(time.monotonic() + 1000) == 1
+        assert len(sweeper) == 0
+
+    def test_get_sweeper(self):
+        assert tm.get_sweeper() is tm.get_sweeper()
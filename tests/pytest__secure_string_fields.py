@@ -0,0 +1,126 @@
+import dataclasses
+import typing
+import pytest
+import secure_string.secure_string_fields as tm
+from secure_string import SecureString, SecureStringContextManager, SecureStringStrictContextManager
+from secure_string.secure_string_obfuscated import SecureStringObfuscated
+
+
+@tm.secure_fields
+class Config:
+    user: str
+    password: str = tm.SecureField()
+    token: typing.Optional[str] = tm.SecureField(default=None)
+    api_key: str = tm.SecureField(default='default key')
+    tokens: list = dataclasses.field(default_factory=list)
+    salt: str = tm.SecureField(default_factory=lambda: 'salt', secure_string_class=SecureStringObfuscated)
+
+
+class TestSecureFields:
+    def test_init(self):
+        config = Config('bob', 'my password', token='my token')
+        assert config.user == 'bob'
+        assert isinstance(config.password, SecureString)
+        assert config.password.value == 'my password'
+        assert config.token.value == 'my token'
+        assert config.api_key.value == 'default key'
+        assert config.tokens == []
+        assert isinstance(config.salt, SecureStringObfuscated)
+        assert config.salt.value == 'salt'
+
+        assert Config('bob', 'my password').token is None
+        password = SecureString('my password')
+        assert Config('bob', password).password is password
+
+    def test_repr(self):
+        config = Config('bob', 'my password')
+        expected = "Config(user='bob', password='***', token=None, api_key='***', tokens=[], salt='***')"
+        assert repr(config) == expected
+
+        with SecureStringContextManager(False):
+            assert repr(config) == expected
+
+        with SecureStringStrictContextManager(True):
+            assert repr(config) == expected
+
+    def test_asdict_replace(self):
+        config = Config('bob', 'my password')
+        dict_ = dataclasses.asdict(config)
+        assert isinstance(dict_['password'], SecureString)
+        assert dict_['password'].value == 'my password'
+
+        replaced = dataclasses.replace(config, password='new password')
+        assert isinstance(replaced.password, SecureString)
+        assert replaced.password.value == 'new password'
+        assert replaced.api_key is config.api_key
+
+    def test_dataclass_arguments(self):
+        @tm.secure_fields(frozen=True)
+        class Frozen:
+            password: str = tm.SecureField(default='default')
+
+        frozen = Frozen()
+        assert frozen.password.value == 'default'
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            frozen.password = 'new password'
+
+    def test_existing_dataclass(self):
+        @tm.secure_fields
+        @dataclasses.dataclass
+        class Credentials:
+            password: str = tm.SecureField()
+
+            def check(self) -> bool:
+                return bool(self.password.value)
+
+        credentials = Credentials(password='my password')
+        assert credentials.check()
+        assert repr(credentials).endswith(".Credentials(password='***')")
+
+    def test_custom_repr(self):
+        @tm.secure_fields
+        class Credentials:
+            password: str = tm.SecureField()
+
+            def __repr__(self):
+                return 'custom'
+
+        assert repr(Credentials('my password')) == 'custom'
+
+    def test_existing_dataclass_custom_repr(self):
+        @tm.secure_fields
+        @dataclasses.dataclass
+        class Credentials:
+            password: str = tm.SecureField()
+
+            def __repr__(self):
+                return 'custom'
+
+        assert repr(Credentials('my password')) == 'custom'
+
+    def test_post_init(self):
+        seen = []
+
+        @tm.secure_fields
+        class Credentials:
+            password: str = tm.SecureField(default='default')
+            token: str = tm.SecureField(default_factory=lambda: 'token')
+            salt: dataclasses.InitVar[str] = 'salt'
+
+            def __post_init__(self, salt):
+                seen.append((type(self.password), type(self.token), salt))
+
+        credentials = Credentials()
+        assert seen == [(SecureString, SecureString, 'salt')]
+        assert credentials.password.value == 'default'
+        Credentials(password='my password', salt='pepper')
+        assert seen[1] == (SecureString, SecureString, 'pepper')
+
+    def test_metadata(self):
+        @tm.secure_fields
+        class Credentials:
+            password: str = tm.SecureField(metadata={'doc': 'the password'})
+
+        field, = dataclasses.fields(Credentials)
+        assert field.metadata['doc'] == 'the password'
+        assert field.metadata[tm.SECURE_FIELD_METADATA_KEY] is SecureString
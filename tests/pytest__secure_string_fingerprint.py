@@ -0,0 +1,22 @@
+import hashlib
+import hmac
+import secure_string.secure_string_fingerprint as tm
+
+
+class TestFingerprint:
+    def test_fingerprint(self):
+        assert tm.fingerprint('hello', key=b'key') == hmac.new(b'key', b'hello', hashlib.sha256).hexdigest()[:8]
+        assert tm.fingerprint('hello', key='key') == tm.fingerprint('hello', key=b'key')
+        assert tm.fingerprint('hello', key='key') != tm.fingerprint('hello', key='other key')
+        assert tm.fingerprint('hello', key='key') != tm.fingerprint('bye', key='key')
+        assert len(tm.fingerprint('hello', key='key', length=16)) == 16
+
+    def test_default_key(self, monkeypatch):
+        monkeypatch.setattr(tm, '_process_key', None)
+        monkeypatch.setenv(tm.FINGERPRINT_KEY_ENV, 'deployment key')
+        assert tm.fingerprint('hello') == tm.fingerprint('hello', key='deployment key')
+
+        monkeypatch.setattr(tm, '_process_key', None)
+        monkeypatch.delenv(tm.FINGERPRINT_KEY_ENV)
+        assert tm.fingerprint('hello') == tm.fingerprint('hello')  # random per-process key
+        assert tm.fingerprint('hello') != tm.fingerprint('hello', key='deployment key')
@@ -3,6 +3,9 @@ import pytest
 import pickle
 import copy
 import json
+import sys
+import hmac
+import hashlib
 import secure_string.secure_string_itself as tm
 from secure_string.secure_string_strict_exceptions import SecureStringStrictError
 from secure_string import SecureStringStrictContextManager
@@ -25,10 +28,18 @@ class TestSecureString:
             assert tm.SecureString('hello').value == 'hello'
 
     def test__add(self):
-        assert tm.SecureString('hello') + ' Bob' == tm.SecureString._fake_value + ' Bob'
+        assert isinstance(tm.SecureString('hello') + ' Bob', tm.SecureString)
+        assert str(tm.SecureString('hello') + ' Bob') == tm.SecureString._fake_value + ' Bob'
+        assert (tm.SecureString('hello') + ' Bob').value == 'hello Bob'
+
+        with pytest.raises(TypeError):
+            _r = tm.SecureString('hello') + 1
 
         with tm.SecureStringContextManager(False):
             assert tm.SecureString('hello') + ' Bob' == 'hello Bob'
+            assert type(tm.SecureString('hello') + ' Bob') is str
+            assert type(tm.SecureString('hello') + tm.SecureString(' Bob')) is str
+            assert json.dumps(tm.SecureString('hello') + ' Bob') == '"hello Bob"'
 
         with SecureStringStrictContextManager(True):
             with pytest.raises(SecureStringStrictError):
@@ -235,10 +246,16 @@ class TestSecureString:
                 _r = tm.SecureString('hello') != tm.SecureString('foo')
 
     def test__radd(self):
-        assert 'say ' + tm.SecureString('hello') == 'say ' + tm.SecureString._fake_value
+        assert isinstance('say ' + tm.SecureString('hello'), tm.SecureString)
+        assert str('say ' + tm.SecureString('hello')) == 'say ' + tm.SecureString._fake_value
+        assert ('say ' + tm.SecureString('hello')).value == 'say hello'
+
+        with pytest.raises(TypeError):
+            _r = 1 + tm.SecureString('hello')
 
         with tm.SecureStringContextManager(False):
             assert 'say ' + tm.SecureString('hello') == 'say hello'
+            assert ''.join(['say ' + tm.SecureString('hello')]) == 'say hello'
 
         with SecureStringStrictContextManager(True):
             with pytest.raises(SecureStringStrictError):
@@ -301,14 +318,17 @@ class TestSecureString:
                 _r = 2 * tm.SecureString('hello')
 
     def test__sizeof(self):
-        assert tm.SecureString('hello').__sizeof__()
+        ss = tm.SecureString('hello')
+        assert ss.__sizeof__() == str.__sizeof__(ss) + 'hello'.__sizeof__()
+        assert sys.getsizeof(tm.SecureString('hello' * 100)) > sys.getsizeof('hello' * 100)
 
         with tm.SecureStringContextManager(False):
-            assert tm.SecureString('hello').__sizeof__() == 'hello'.__sizeof__()
+            assert ss.__sizeof__() == str.__sizeof__(ss) + 'hello'.__sizeof__()
+            assert ss.__sizeof__() > str.__sizeof__('***')
 
         with SecureStringStrictContextManager(True):
             with pytest.raises(SecureStringStrictError):
-                _r = tm.SecureString('hello').__sizeof__()
+                _r = ss.__sizeof__()
 
     def test__str(self):
         assert str(tm.SecureString('hello')) == str(tm.SecureString._fake_value)
@@ -884,3 +904,141 @@ class TestSecureString:
         with SecureStringStrictContextManager(True):
             with pytest.raises(SecureStringStrictError):
                 _r = reversed(tm.SecureString('hello'))
+
+
+class TestSecureStringPolicy:
+    def test_policy(self):
+        policy = tm.SecureString.policy()
+        assert policy['__str__'] is tm.SecureStringPolicy.FAKE
+        assert policy['__len__'] is tm.SecureStringPolicy.FORBID
+        assert '__hash__' not in policy
+        assert 'value' not in policy
+
+    def test_with_policy(self):
+        cls = tm.SecureString.with_policy(__len__='passthrough', __eq__=tm.SecureStringPolicy.PASSTHROUGH, upper='fake')
+        assert issubclass(cls, tm.SecureString)
+        assert cls is tm.SecureString.with_policy({'__len__': 'passthrough', '__eq__': 'passthrough', 'upper': 'fake'})
+        assert cls.policy()['__len__'] is tm.SecureStringPolicy.PASSTHROUGH
+        assert tm.SecureString.policy()['__len__'] is tm.SecureStringPolicy.FORBID
+
+        ss = cls('hello')
+        assert len(ss) == 5
+        assert ss == 'hello'
+        assert ss == cls('hello')
+        assert ss.upper() == tm.SecureString._fake_value.upper()
+        assert str(ss) == tm.SecureString._fake_value
+        assert hash(ss) == hash('hello')
+        assert isinstance(copy.copy(ss), cls)
+
+        with pytest.raises(tm.SecureStringDoesNotSupportError):
+            len(tm.SecureString('hello'))
+
+        with tm.SecureStringContextManager(False):
+            assert ss.upper() == 'HELLO'
+
+        with SecureStringStrictContextManager(True):
+            with pytest.raises(SecureStringStrictError):
+                len(ss)
+
+    def test_with_policy_forbid(self):
+        cls = tm.SecureString.with_policy(__str__='forbid')
+
+        with pytest.raises(tm.SecureStringDoesNotSupportError):
+            str(cls('hello'))
+
+        with tm.SecureStringContextManager(False):
+            assert str(cls('hello')) == 'hello'
+
+    def test_with_policy_add(self):
+        assert tm.SecureString.policy()['__add__'] is tm.SecureStringPolicy.FAKE
+
+        cls = tm.SecureString.with_policy(__add__='passthrough')
+        assert cls('hello') + ' Bob' == 'hello Bob'
+        assert type(cls('hello') + ' Bob') is str
+
+        back = cls.with_policy(__add__='fake')
+        assert (back('hello') + ' Bob').value == 'hello Bob'
+        assert str(back('hello') + ' Bob') == '*** Bob'
+
+        forbidden = tm.SecureString.with_policy(__add__='forbid')
+        with pytest.raises(tm.SecureStringDoesNotSupportError):
+            _r = forbidden('hello') + ' Bob'
+
+    def test_with_policy_nothing_changed(self):
+        assert tm.SecureString.with_policy() is tm.SecureString
+        assert tm.SecureString.with_policy(__len__='forbid') is tm.SecureString
+
+    def test_with_policy_errors(self):
+        with pytest.raises(ValueError):
+            tm.SecureString.with_policy(__hash__='passthrough')
+
+        with pytest.raises(ValueError):
+            tm.SecureString.with_policy(__len__='allow')
+
+
+class TestSecureStringHmac:
+    def test_hmac(self):
+        key = tm.SecureString('my key')
+        expected = hmac.new(b'my key', b'part1part2', hashlib.sha256).hexdigest()
+
+        signature = key.hmac('sha256')
+        signature.update(b'part1')
+        signature.update(memoryview(b'part2'))
+        assert signature.hexdigest() == expected
+
+        # the cached state is not changed by updates of copies
+        assert key.hmac('sha256').hexdigest() == hmac.new(b'my key', b'', hashlib.sha256).hexdigest()
+        assert key.hmac(hashlib.sha256) is not key.hmac(hashlib.sha256)
+
+        with tm.SecureStringContextManager(False):
+            assert key.hmac('sha256').hexdigest() == hmac.new(b'my key', b'', hashlib.sha256).hexdigest()
+
+    def test_hmac_expired(self):
+        key = tm.SecureString('my key')
+        key.hmac('sha256')
+        key._expire()
+        assert '_hmac_states' not in key.__dict__
+
+        key = tm.SecureString('my key', ttl=-1)
+        with pytest.raises(tm.SecureStringExpiredError):
+            key.hmac('sha256')
+
+
+class TestSecureStringGenerateMany:
+    @pytest.mark.parametrize('nbytes', [1, 16, 32, 33])
+    def test_urlsafe(self, nbytes):
+        import secrets
+        tokens = list(tm.SecureString.generate_many(5000, nbytes=nbytes))
+        assert len(tokens) == 5000
+        assert all(type(token) is tm.SecureString for token in tokens)
+        assert str(tokens[0]) == tm.SecureString._fake_value
+
+        values = [token._orig_value for token in tokens]
+        assert all(len(value) == len(secrets.token_urlsafe(nbytes)) for value in values)
+        assert all(set(value) <= set('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_') for value in values)
+        if nbytes >= 16:
+            assert len(set(values)) == 5000
+
+    def test_alphabet(self):
+        values = [token._orig_value for token in tm.SecureString.generate_many(3000, nbytes=4, alphabet='0123456789')]
+        assert len(values) == 3000
+        assert all(len(value) == 10 and value.isdigit() for value in values)
+        assert set(''.join(values)) == set('0123456789')
+
+    def test_kwargs_and_empty(self):
+        assert list(tm.SecureString.generate_many(0)) == []
+        token, = tm.SecureString.generate_many(1, mask=lambda value: value[:2] + '***')
+        assert str(token) == token._orig_value[:2] + '***'
+
+    def test_errors(self):  # raised at call time, not on the first next()
+        with pytest.raises(ValueError):
+            tm.SecureString.generate_many(1, alphabet='aa')
+
+        with pytest.raises(ValueError):
+            tm.SecureString.generate_many(1, alphabet='абв')
+
+        with pytest.raises(ValueError):
+            tm.SecureString.generate_many(1, nbytes=0)
+
+        with pytest.raises(ValueError):
+            tm.SecureString.generate_many(-1)
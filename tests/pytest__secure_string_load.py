@@ -0,0 +1,101 @@
+import base64
+import pytest
+import secure_string.secure_string_load as tm
+from secure_string import SecureString
+from secure_string.secure_string_obfuscated import SecureStringObfuscated
+
+
+@pytest.fixture
+def secrets_dir(tmp_path):
+    directory = tmp_path / 'secrets'
+    directory.mkdir()
+    (directory / 'DB_PASSWORD').write_text('db password\n')
+    (directory / 'API_KEY.b64').write_bytes(base64.b64encode(b'api key'))
+    (directory / 'SALT.hex').write_text(b'salt'.hex())
+    (directory / 'OTHER').write_text('other')
+    (directory / '..data').mkdir()
+    return directory
+
+
+class TestLoad:
+    def test_secrets_dir(self, secrets_dir):
+        secrets = tm.load(secrets_dir=secrets_dir, environ=False)
+        assert set(secrets) == {'DB_PASSWORD', 'API_KEY', 'SALT', 'OTHER'}
+        assert len(secrets) == 4
+        assert secrets._values == {}  # lazy
+
+        assert isinstance(secrets['DB_PASSWORD'], SecureString)
+        assert secrets['DB_PASSWORD'].value == 'db password'
+        assert secrets['DB_PASSWORD'] is secrets['DB_PASSWORD']
+        assert secrets['API_KEY'].value == 'api key'
+        assert secrets['SALT'].value == 'salt'
+        assert len(secrets) == 4
+        assert 'DB_PASSWORD' in secrets
+        assert 'NOTHING' not in secrets
+
+        with pytest.raises(KeyError):
+            _r = secrets['NOTHING']
+
+    def test_pattern(self, secrets_dir):
+        assert set(tm.load(r'DB_.*|API_KEY', secrets_dir=secrets_dir, environ=False)) == {'DB_PASSWORD', 'API_KEY'}
+        assert set(tm.load(['SALT', 'OTHER'], secrets_dir=[secrets_dir], environ=False)) == {'SALT', 'OTHER'}
+
+    def test_dotenv(self, tmp_path):
+        dotenv = tmp_path / '.env'
+        dotenv.write_text(
+            '# comment\n'
+            '\n'
+            'export USER=bob\n'
+            'PASSWORD="my \\"password\\"\\n" # comment\n'
+            "TOKEN='my token'\n"
+            'API_KEY_B64=' + base64.b64encode(b'api key').decode() + '\n'
+            'broken line\n'
+            'HASH=abc#123\n'
+            'URL=http://x/#frag # comment\n'
+            'EMPTY= # comment\n'
+            "QUOTED='a # b'#comment\n"
+        )
+        secrets = tm.load(dotenv=str(dotenv), environ=False)
+        assert {name: value.value for name, value in secrets.items()} == {
+            'USER': 'bob', 'PASSWORD': 'my "password"\n', 'TOKEN': 'my token', 'API_KEY': 'api key',
+            'HASH': 'abc#123', 'URL': 'http://x/#frag', 'EMPTY': '', 'QUOTED': 'a # b',
+        }
+
+    def test_environ(self, monkeypatch):
+        monkeypatch.setenv('SECURE_STRING_TEST_PASSWORD', 'my password')
+        secrets = tm.load(r'SECURE_STRING_TEST_.*')
+        assert list(secrets) == ['SECURE_STRING_TEST_PASSWORD']
+        assert secrets['SECURE_STRING_TEST_PASSWORD'].value == 'my password'
+
+        secrets = tm.load(environ={'TOKEN_HEX': b'token'.hex()}, secure_string_class=SecureStringObfuscated)
+        assert isinstance(secrets['TOKEN'], SecureStringObfuscated)
+        assert secrets['TOKEN'].value == 'token'
+
+    def test_override(self, secrets_dir, tmp_path):
+        dotenv = tmp_path / '.env'
+        dotenv.write_text('DB_PASSWORD=from dotenv\nOTHER=from dotenv\n')
+        secrets = tm.load(secrets_dir=secrets_dir, dotenv=dotenv, environ={'OTHER': 'from environ'})
+        assert secrets['DB_PASSWORD'].value == 'from dotenv'
+        assert secrets['OTHER'].value == 'from environ'
+        assert secrets['SALT'].value == 'salt'
+        assert len(secrets) == 4
+
+    def test_decode_error(self):
+        with pytest.raises(ValueError):
+            tm.load('TOKEN', environ={'TOKEN_B64': 'not base64!'})
+
+        # not requested environment variables are skipped
+        secrets = tm.load(environ={'COLOR_HEX': '#ff0000', 'TOKEN_HEX': b'token'.hex()})
+        assert list(secrets) == ['TOKEN']
+
+    def test_dotenv_decode_error(self, tmp_path):
+        dotenv = tmp_path / '.env'
+        dotenv.write_text('COLOR_HEX=#ff0000\n')
+        with pytest.raises(ValueError):
+            tm.load(dotenv=dotenv, environ=False)
+
+    def test_immutable_repr(self):
+        secrets = tm.load(environ={'TOKEN': 'my token'})
+        with pytest.raises(TypeError):
+            secrets['TOKEN'] = SecureString('new token')
+        assert repr(secrets) == "SecureStringMapping({'TOKEN': '***'})"
@@ -0,0 +1,79 @@
+import copy
+import json
+import pickle
+import pytest
+import secure_string.secure_string_mask as tm
+from secure_string import SecureString, SecureStringContextManager
+
+
+class TestSecureStringMask:
+    def test_fixed(self):
+        ss = SecureString('hello', mask=tm.SecureStringFixedMask('<hidden>'))
+        assert str(ss) == '<hidden>'
+        assert tm.SecureStringFixedMask()('hello') == '***'
+
+    def test_last_chars(self):
+        mask = tm.SecureStringLastCharsMask(4)
+        assert mask('4111111111111234') == '************1234'
+        assert mask('12345678') == '********'
+        assert tm.SecureStringLastCharsMask(2, char='#')('hello') == '###lo'
+
+    def test_last_chars_bounds(self):
+        assert tm.SecureStringLastCharsMask(0)('supersecret') == '***********'
+        assert tm.SecureStringLastCharsMask(0)('') == ''
+        assert tm.SecureStringLastCharsMask(11)('supersecret') == '***********'
+        assert tm.SecureStringLastCharsMask(20)('supersecret') == '***********'
+
+        with pytest.raises(ValueError):
+            tm.SecureStringLastCharsMask(-1)
+
+    def test_length(self):
+        assert tm.SecureStringLengthMask()('hello') == '*****'
+        assert tm.SecureStringLengthMask('x')('') == ''
+
+    def test_payload(self):
+        """the mask is the str payload, C-level consumers get it without calling SecureString methods"""
+        ss = SecureString('4111111111111234', mask=tm.SecureStringLastCharsMask(4))
+        assert ''.join([ss]) == '************1234'
+        assert json.dumps(ss) == '"************1234"'
+        assert f'{ss}' == '************1234'
+        assert ''.join(['card ', 'card ' + ss]) == 'card card ************1234'
+        assert ss.value == '4111111111111234'
+
+        with SecureStringContextManager(False):
+            assert str(ss) == '4111111111111234'
+
+    def test_class_mask(self):
+        class CardNumber(SecureString):
+            _mask = tm.SecureStringLastCharsMask(4)
+
+        assert str(CardNumber('4111111111111234')) == '************1234'
+        assert str(CardNumber('4111111111111234', mask=tm.SecureStringLengthMask())) == '****************'
+        assert str(SecureString('4111111111111234')) == SecureString._fake_value
+
+    def test_copy(self):
+        ss = SecureString('hello', mask=tm.SecureStringLengthMask())
+        assert str(copy.copy(ss)) == '*****'
+        assert str(copy.deepcopy(ss)) == '*****'
+
+    def test_fingerprint(self):
+        mask = tm.SecureStringFingerprintMask(key='key')
+        first = SecureString('token', mask=mask)
+        second = SecureString('token', mask=mask)
+        other = SecureString('other token', mask=mask)
+
+        assert str(first).startswith('***')
+        assert len(str(first)) == 3 + 8
+        assert str(first) == str(second)
+        assert str(first) != str(other)
+        assert str(SecureString('token', mask=tm.SecureStringFingerprintMask(key='key', prefix='#', length=4)))[1:] == \
+            str(first)[3:7]
+
+    def test_fingerprint_pickle(self):
+        """the default key is resolved on pickling, e.g. for worker processes"""
+        mask = tm.SecureStringFingerprintMask()
+        restored = pickle.loads(pickle.dumps(mask))
+        assert restored._key is not None
+        assert restored('my password') == mask('my password')
+        assert mask._key is None
+
@@ -0,0 +1,81 @@
+import collections
+import csv
+import io
+import json
+import types
+import secure_string.secure_string_materialize as tm
+from secure_string import SecureString, SecureStringContextManager, SecureStringStrictContextManager
+from secure_string.secure_string_mask import SecureStringLastCharsMask
+from secure_string.secure_string_rotating import RotatingSecureString
+
+Point = collections.namedtuple('Point', 'x y')
+
+
+class TestMaterialize:
+    def test_reveal(self):
+        password = SecureString('my password')
+        data = {'user': 'bob', 'password': password, 'tokens': [SecureString('t1'), 't2'], 'n': 1}
+        revealed = tm.reveal(data)
+        assert revealed == {'user': 'bob', 'password': 'my password', 'tokens': ['t1', 't2'], 'n': 1}
+        assert type(revealed['password']) is str
+        assert json.dumps(revealed) == '{"user": "bob", "password": "my password", "tokens": ["t1", "t2"], "n": 1}'
+        assert data['password'] is password
+
+    def test_mask(self):
+        card = SecureString('4111111111111234', mask=SecureStringLastCharsMask(4))
+        masked = tm.mask((card, {SecureString('key'): 'value'}, {SecureString('x')}, frozenset(['y'])))
+        assert masked == ('************1234', {'***': 'value'}, {'***'}, frozenset(['y']))
+        assert type(masked[0]) is str
+
+        with SecureStringStrictContextManager(True):
+            assert tm.mask(card) == '************1234'
+
+    def test_sharing(self):
+        untouched = {'a': [1, 2, ('x', None)], 'b': {'c': b'd'}}
+        assert tm.reveal(untouched) is untouched
+
+        data = {'shared': untouched['a'], 'secret': SecureString('s')}
+        assert tm.mask(data)['shared'] is untouched['a']
+
+    def test_namedtuple_rotating(self):
+        assert tm.reveal(Point(SecureString('x'), 1)) == Point('x', 1)
+        assert tm.reveal([RotatingSecureString('current')]) == ['current']
+        assert tm.reveal(object) is object
+
+    def test_materialize(self):
+        row = ['bob', SecureString('my password')]
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(tm.materialize(row))
+        assert buffer.getvalue() == 'bob,***\r\n'
+
+        with SecureStringContextManager(False):
+            assert ', '.join(tm.materialize(row)) == 'bob, my password'
+
+    def test_mappings(self):
+        ordered = tm.reveal(collections.OrderedDict([('b', SecureString('1')), ('a', SecureString('2'))]))
+        assert type(ordered) is collections.OrderedDict
+        assert list(ordered.items()) == [('b', '1'), ('a', '2')]
+
+        default = tm.reveal(collections.defaultdict(list, {'a': SecureString('1')}))
+        assert type(default) is collections.defaultdict
+        assert default == {'a': '1'}
+        assert default['missing'] == []
+
+        proxy = tm.mask(types.MappingProxyType({'a': SecureString('1')}))
+        assert type(proxy) is types.MappingProxyType
+        assert dict(proxy) == {'a': '***'}
+
+        chain = tm.reveal(collections.ChainMap({'a': SecureString('1')}))
+        assert type(chain) is collections.ChainMap
+        assert chain == {'a': '1'}
+
+    def test_cycles(self):
+        data = [SecureString('s')]
+        data.append(data)
+        revealed = tm.reveal(data)
+        assert revealed[0] == 's'
+        assert revealed[1] is data
+
+        mapping = {'secret': SecureString('s')}
+        mapping['self'] = mapping
+        assert tm.mask(mapping)['secret'] == '***'
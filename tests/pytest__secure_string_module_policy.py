@@ -0,0 +1,73 @@
+import gc
+import pytest
+import secure_string.secure_string_module_policy as tm
+from secure_string import SecureString, SecureStringContextManager
+
+
+def _render(value):
+    return str(value)
+
+
+@pytest.fixture(autouse=True)
+def _clear_policies():
+    yield
+    for module in tm.module_policies():
+        tm.set_module_policy(module, None)
+
+
+class TestModulePolicy:
+    def test_policy(self):
+        ss = SecureString('my password')
+        assert _render(ss) == '***'
+
+        tm.set_module_policy(__name__, False)
+        assert tm.module_policies() == {__name__: False}
+        assert _render(ss) == 'my password'
+        assert _render(ss) == 'my password'  # cached
+
+        with SecureStringContextManager(True):  # a context wins
+            assert _render(ss) == '***'
+
+        tm.set_module_policy(__name__, None)
+        assert tm.module_policies() == {}
+        assert SecureStringContextManager._resolver is None
+        assert _render(ss) == '***'
+
+    def test_prefix(self):
+        ss = SecureString('my password')
+        package, _, _ = __name__.rpartition('.')
+
+        tm.set_module_policy(__name__ + 'x', False)  # not a parent module
+        assert _render(ss) == '***'
+
+        if package:
+            tm.set_module_policy(package, False)
+            assert _render(ss) == 'my password'
+
+        tm.set_module_policy(__name__, False)
+        tm.set_module_policy(__name__, True)  # the cache is invalidated on changes
+        assert _render(ss) == '***'
+
+    def test_other_module(self):
+        ss = SecureString('my password')
+        namespace = {'__name__': 'some_driver.connection'}
+        exec('def render(value):\n    return str(value)', namespace)
+
+        tm.set_module_policy('some_driver', False)
+        assert namespace['render'](ss) == 'my password'
+        assert _render(ss) == '***'
+
+    def test_cache_does_not_keep_code(self):
+        ss = SecureString('my password')
+        tm.set_module_policy('some_driver', False)
+        namespace = {'__name__': 'some_driver.connection'}
+        exec('def render(value):\n    return str(value)', namespace)
+        code = namespace['render'].__code__
+
+        assert namespace['render'](ss) == 'my password'
+        assert id(code) in tm._decisions
+
+        key = id(code)
+        del namespace, code
+        gc.collect()
+        assert key not in tm._decisions
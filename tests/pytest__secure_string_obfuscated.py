@@ -0,0 +1,64 @@
+import copy
+import gc
+import pytest
+import secure_string.secure_string_obfuscated as tm
+from secure_string import SecureString, SecureStringContextManager
+from secure_string.secure_string_exceptions import SecureStringExpiredError
+from secure_string.secure_string_keystream import xor_keystream
+
+
+class TestXorKeystream:
+    def test_roundtrip(self):
+        ciphertext = xor_keystream(b'key', b'nonce', 'привет'.encode())
+        assert ciphertext != 'привет'.encode()
+        assert xor_keystream(b'key', b'nonce', ciphertext) == 'привет'.encode()
+        assert xor_keystream(b'key', b'other nonce', ciphertext) != 'привет'.encode()
+        assert xor_keystream(b'key', b'nonce', b'') == b''
+        assert xor_keystream(b'key', b'nonce', b'\x00\x00')[:1] == xor_keystream(b'key', b'nonce', b'\x00')
+
+
+class TestSecureStringObfuscated:
+    def test_value(self, monkeypatch):
+        monkeypatch.setattr(tm.SecureStringObfuscated, '_cache_size', 0)
+        ss = tm.SecureStringObfuscated('hello')
+        assert isinstance(ss, SecureString)
+        assert 'hello' not in ss.__dict__.values()
+        assert b'hello' not in ss.__dict__.values()
+        assert ss.value == 'hello'
+        assert str(ss) == SecureString._fake_value
+        assert hash(ss) == hash('hello')
+
+        with SecureStringContextManager(False):
+            assert str(ss) == 'hello'
+            assert ss + ' Bob' == 'hello Bob'
+
+    def test_cache(self, monkeypatch):
+        monkeypatch.setattr(tm.SecureStringObfuscated, '_cache_size', 2)
+        monkeypatch.setattr(tm.SecureStringObfuscated, '_cache', tm.OrderedDict())
+        first, second, third = (tm.SecureStringObfuscated(v) for v in ('first', 'second', 'third'))
+
+        assert first.value == 'first'
+        assert second.value == 'second'
+        assert first.value == 'first'  # the most recently used
+        assert third.value == 'third'
+        assert list(tm.SecureStringObfuscated._cache.values()) == ['first', 'third']
+
+        del first
+        gc.collect()
+        assert list(tm.SecureStringObfuscated._cache.values()) == ['third']
+
+    def test_copy(self):
+        ss = tm.SecureStringObfuscated('hello')
+        copied = copy.copy(ss)
+        assert isinstance(copied, tm.SecureStringObfuscated)
+        assert copied._nonce != ss._nonce
+        assert copied.value == 'hello'
+
+    def test_expire(self):
+        ss = tm.SecureStringObfuscated('hello')
+        assert ss.value == 'hello'
+        ss._expire()
+        assert '_ciphertext' not in ss.__dict__
+        assert ss.__dict__.get('_orig_value') is None
+        with pytest.raises(SecureStringExpiredError):
+            _r = ss._orig_value
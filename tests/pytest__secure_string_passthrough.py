@@ -0,0 +1,98 @@
+import pickle
+import threading
+import pytest
+import secure_string.secure_string_passthrough as tm
+from secure_string import SecureString, SecureStringStrictContextManager
+from secure_string.secure_string_exceptions import SecureStringDoesNotSupportError
+from secure_string.secure_string_obfuscated import SecureStringObfuscated
+from secure_string.secure_string_profile import SecureStringProfiler
+
+
+class TestSecureStringPassthrough:
+    def test_passthrough(self):
+        ss = SecureString('hello')
+        wrapped_str = vars(SecureString)['__str__']
+
+        with tm.passthrough():
+            assert tm.SecureStringPassthrough.is_active()
+            assert vars(SecureString)['__str__'] is not wrapped_str
+            assert str(ss) == 'hello'
+            assert f'{ss:>6}' == ' hello'
+            assert ss == 'hello'
+            assert ss == SecureString('hello')
+            assert ss != SecureString('bye')
+            assert len(ss) == 5
+            assert 'ell' in ss
+            assert ss[1:3] == 'el'
+            assert ss.upper() == 'HELLO'
+            assert ss.replace(SecureString('l'), 'L') == 'heLLo'
+            assert ss + ' Bob' == 'hello Bob'
+            assert 'say ' + ss == 'say hello'
+            assert ss + SecureString(' Bob') == 'hello Bob'
+            assert 'x %s x' % ss == 'x hello x'
+            assert hash(ss) == hash('hello')
+            assert str(SecureStringObfuscated('hello')) == 'hello'
+
+            with SecureStringStrictContextManager(True):
+                assert str(ss) == 'hello'
+
+            with pytest.raises(SecureStringDoesNotSupportError):
+                pickle.dumps(ss)
+
+        assert not tm.SecureStringPassthrough.is_active()
+        assert vars(SecureString)['__str__'] is wrapped_str
+        assert str(ss) == SecureString._fake_value
+
+        with pytest.raises(SecureStringDoesNotSupportError):
+            len(ss)
+
+    def test_nested(self):
+        with tm.passthrough():
+            with tm.passthrough():
+                assert str(SecureString('hello')) == 'hello'
+            assert str(SecureString('hello')) == 'hello'
+
+        assert str(SecureString('hello')) == SecureString._fake_value
+
+    def test_process_wide(self):
+        results = []
+        thread = threading.Thread(target=lambda: results.append(str(SecureString('hello'))))
+
+        with tm.passthrough():
+            thread.start()
+            thread.join()
+
+        assert results == ['hello']
+
+    def test_policy_classes(self):
+        cls = SecureString.with_policy(__str__='forbid')
+
+        with tm.passthrough():
+            with pytest.raises(SecureStringDoesNotSupportError):
+                str(cls('hello'))
+            assert len(cls('hello')) == 5  # inherited
+
+    def test_overlapping_profiler(self):
+        original = dict(vars(SecureString))
+        ss = SecureString('hello')
+        profiler = SecureStringProfiler()
+        scope = tm.passthrough()
+
+        try:
+            profiler.enable()
+            scope.__enter__()
+            profiler.disable()  # the profiler scope ends first
+            assert str(ss) == 'hello'
+            scope.__exit__(None, None, None)
+            assert dict(vars(SecureString)) == original
+
+            scope.__enter__()
+            profiler.enable()
+            scope.__exit__(None, None, None)  # the passthrough scope ends first
+            assert str(ss) == SecureString._fake_value
+            profiler.disable()
+            assert dict(vars(SecureString)) == original
+        finally:
+            profiler.disable()
+            while tm.SecureStringPassthrough.is_active():
+                scope.__exit__(None, None, None)
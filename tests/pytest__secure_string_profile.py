@@ -0,0 +1,103 @@
+import asyncio
+import pytest
+import secure_string.secure_string_profile as tm
+from secure_string import SecureString, SecureStringContextManager, SecureStringStrictContextManager
+from secure_string.secure_string_context import unprotected
+from secure_string.secure_string_strict_context import strict
+from secure_string.secure_string_strict_exceptions import SecureStringStrictError
+
+
+class TestSecureStringProfiler:
+    def test_disabled_has_no_wrappers(self):
+        orig_str = SecureString.__dict__['__str__']
+        orig_enter = SecureStringContextManager.__dict__.get('__enter__')
+
+        with tm.profile():
+            assert SecureString.__dict__['__str__'] is not orig_str
+            assert SecureStringContextManager.__dict__.get('__enter__') is not None
+
+        assert SecureString.__dict__['__str__'] is orig_str
+        assert SecureStringContextManager.__dict__.get('__enter__') is orig_enter
+
+    def test_snapshot(self):
+        ss = SecureString('hello')
+
+        with tm.profile() as profiler:
+            assert str(ss) == SecureString._fake_value
+
+            with SecureStringContextManager(False):
+                with SecureStringContextManager(False):
+                    assert str(ss) == 'hello'
+
+            with SecureStringStrictContextManager(True):
+                with pytest.raises(SecureStringStrictError):
+                    str(ss)
+
+        snapshot = profiler.snapshot()
+        assert set(snapshot['methods']['__str__']) == {'protected', 'unprotected', 'strict'}
+        assert snapshot['methods']['__str__']['protected']['calls'] == 1
+        assert snapshot['methods']['__str__']['protected']['total_ns'] >= 0
+        assert snapshot['depth']['SecureStringContextManager'] == {'current': 0, 'max': 2}
+        assert snapshot['depth']['SecureStringStrictContextManager'] == {'current': 0, 'max': 1}
+
+        str(ss)
+        assert profiler.snapshot()['methods']['__str__']['protected']['calls'] == 1
+
+        profiler.reset()
+        assert profiler.snapshot()['methods'] == {}
+
+    def test_async_depth(self):
+        async def main():
+            async with SecureStringContextManager(False):
+                return SecureStringContextManager.is_protected()
+
+        with tm.profile() as profiler:
+            assert asyncio.run(main()) is False
+
+        assert profiler.snapshot()['depth']['SecureStringContextManager'] == {'current': 0, 'max': 1}
+
+    def test_scoped_depth(self):
+        @unprotected
+        def read(ss):
+            return str(ss)
+
+        @strict
+        async def read_async():
+            return SecureStringStrictContextManager.is_strict()
+
+        with tm.profile() as profiler:
+            with SecureStringContextManager(False):
+                assert read(SecureString('hello')) == 'hello'
+            assert asyncio.run(read_async()) is True
+
+        snapshot = profiler.snapshot()
+        assert snapshot['depth']['SecureStringContextManager'] == {'current': 0, 'max': 2}
+        assert snapshot['depth']['SecureStringStrictContextManager'] == {'current': 0, 'max': 1}
+        assert snapshot['methods']['__str__']['unprotected']['calls'] == 1
+
+        assert read(SecureString('hello')) == 'hello'  # the fast path after the profiler is disabled
+        assert profiler.snapshot()['depth']['SecureStringContextManager'] == {'current': 0, 'max': 2}
+
+    def test_single_active(self):
+        with tm.profile() as profiler:
+            profiler.enable()  # already enabled, nothing happens
+            with pytest.raises(RuntimeError):
+                tm.SecureStringProfiler().enable()
+
+        assert not profiler.enabled
+        assert tm.SecureStringProfiler._active is None
+
+    def test_continue_profiling(self):
+        profiler = tm.SecureStringProfiler()
+
+        for _ in range(2):
+            with tm.profile(profiler):
+                repr(SecureString('hello'))
+
+        assert profiler.snapshot()['methods']['__repr__']['protected']['calls'] == 2
+
+    def test_class_and_static_methods(self):
+        with tm.profile():
+            assert '__str__' in SecureString.policy()
+            assert SecureString.with_policy() is SecureString
+            assert SecureString('hello').value == 'hello'
@@ -0,0 +1,49 @@
+import gc
+import pytest
+import secure_string.secure_string_registry as tm
+from secure_string import SecureString
+from secure_string.secure_string_obfuscated import SecureStringObfuscated
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    registry = tm.SecureStringRegistry()
+    monkeypatch.setattr(tm, '_registry', registry)
+    tm.track()
+    yield registry
+    tm.track(False)
+
+
+class TestSecureStringRegistry:
+    def test_disabled(self):
+        tm.track(False)
+        assert '__init__' not in vars(SecureString)
+
+    def test_stats(self, registry):
+        password = SecureString('my password')
+        obfuscated = SecureStringObfuscated('my password')
+        rope = password + '!'
+        _untracked = str.__new__(SecureString, '***')
+
+        stats = tm.stats()
+        assert stats['count'] == 3
+        assert stats['types']['secure_string.secure_string_itself.SecureString'] == {
+            'count': 1, 'plaintext_object_bytes': 'my password'.__sizeof__(),
+        }
+        assert stats['types']['secure_string.secure_string_obfuscated.SecureStringObfuscated']['count'] == 1
+        assert stats['types']['secure_string.secure_string_rope.SecureStringRope'] == {'count': 1, 'plaintext_object_bytes': 0}
+        assert stats['plaintext_object_bytes'] == sum(t['plaintext_object_bytes'] for t in stats['types'].values())
+        assert 'my password' not in repr(stats)
+
+        del password, obfuscated, rope
+        gc.collect()
+        assert tm.stats()['count'] == 0
+        assert len(registry) == 0
+
+    def test_dead_reference(self, registry):
+        ss = SecureString('hello')
+        ref = next(iter(registry._refs.values()))
+        registry._refs[0] = ref
+        del ss
+        gc.collect()
+        assert tm.stats()['count'] == 0
@@ -0,0 +1,92 @@
+import threading
+from secure_string import SecureString, SecureStringContextManager
+from secure_string.secure_string_obfuscated import SecureStringObfuscated
+import secure_string.secure_string_rotating as tm
+from secure_string.secure_string_template import SecureTemplate
+
+
+class TestRotatingSecureString:
+    def test_rotate(self):
+        password = tm.RotatingSecureString('old password')
+        assert password.version == 0
+        assert password.value == 'old password'
+        old = password.current
+
+        assert password.rotate('new password') == 1
+        assert password.version == 1
+        assert password.current.value == 'new password'
+        assert old.value == 'old password'
+
+        new = SecureString('newest password')
+        password.rotate(new)
+        assert password.snapshot()[0] == 2
+        assert password.snapshot()[1] is new
+
+    def test_render(self):
+        password = tm.RotatingSecureString('my password')
+        assert str(password) == SecureString._fake_value
+        assert f'{password}' == SecureString._fake_value
+        assert repr(password) == "RotatingSecureString('***', version=0)"
+
+        with SecureStringContextManager(False):
+            assert str(password) == 'my password'
+
+    def test_secure_string_class(self):
+        password = tm.RotatingSecureString('old password', secure_string_class=SecureStringObfuscated)
+        password.rotate('new password')
+        assert isinstance(password.current, SecureStringObfuscated)
+
+    def test_subscribe(self):
+        password = tm.RotatingSecureString('old password')
+        calls = []
+        unsubscribe = password.subscribe(lambda current, version: calls.append((current.value, version)))
+
+        password.rotate('new password')
+        unsubscribe()
+        unsubscribe()
+        password.rotate('newest password')
+        assert calls == [('new password', 1)]
+
+    def test_subscribe_from_callback(self):
+        password = tm.RotatingSecureString('old password')
+        calls = []
+
+        def once(current, version):
+            calls.append(version)
+            unsubscribe()
+            password.subscribe(lambda current, version: calls.append(-version))
+
+        unsubscribe = password.subscribe(once)
+        password.rotate('new password')
+        password.rotate('newest password')
+        assert calls == [1, -2]
+
+    def test_template_cache(self):
+        """caches keyed by SecureString objects are invalidated by rotation"""
+        password = tm.RotatingSecureString('old')
+        template = SecureTemplate('{password:hex}')
+        assert template.render(password=password.current).value == b'old'.hex()
+        password.rotate('new')
+        assert template.render(password=password.current).value == b'new'.hex()
+
+    def test_consistent_snapshots(self):
+        password = tm.RotatingSecureString('0')
+        errors = []
+        done = threading.Event()
+
+        def read():
+            while not done.is_set():
+                version, current = password.snapshot()
+                if current.value != str(version):
+                    errors.append((version, current.value))
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        for i in range(1, 1000):
+            password.rotate(str(i))
+        done.set()
+        for reader in readers:
+            reader.join()
+
+        assert errors == []
@@ -0,0 +1,148 @@
+import asyncio
+import sys
+import pytest
+import secure_string.secure_string_strict_context as tm
+from secure_string import SecureString
+from secure_string.secure_string_exceptions import SecureStringDoesNotSupportError
+
+
+class TestSecureStringStrictRecorder:
+    def test_record(self):
+        recorder = tm.SecureStringStrictRecorder()
+        ss = SecureString('hello')
+
+        with tm.SecureStringStrictRecordContextManager(recorder):
+            for _ in range(3):
+                str(ss)  # the same call site
+            _r = f'{ss}'
+            with pytest.raises(SecureStringDoesNotSupportError):
+                len(ss)  # forbidden methods are recorded too
+
+        str(ss)  # out of the context
+        sites = recorder.sites()
+        assert len(sites) == 3
+        assert {(method, count) for (_f, _l, _c, method), count in sites.items()} == {
+            ('__str__', 3), ('__format__', 1), ('__len__', 1),
+        }
+        filename, _lineno, function, _method = next(iter(sites))
+        assert filename == __file__
+        assert function == 'test_record'
+
+        recorder.reset()
+        assert recorder.sites() == {}
+
+    def test_max_sites(self):
+        recorder = tm.SecureStringStrictRecorder(max_sites=1)
+        ss = SecureString('hello')
+
+        with tm.SecureStringStrictRecordContextManager(recorder):
+            str(ss)
+            repr(ss)
+            repr(ss)
+
+        assert len(recorder.sites()) == 1
+        assert recorder.dropped == 2
+
+    def test_sample_rate(self, monkeypatch):
+        with pytest.raises(ValueError):
+            tm.SecureStringStrictRecorder(sample_rate=0)
+
+        recorder = tm.SecureStringStrictRecorder(sample_rate=0.5)
+        samples = iter([0.9, 0.1])
+        monkeypatch.setattr(tm, 'random', lambda: next(samples))
+
+        with tm.SecureStringStrictRecordContextManager(recorder):
+            str(SecureString('hello'))
+            str(SecureString('hello'))
+
+        assert sum(recorder.sites().values()) == 1
+
+    def test_install(self):
+        recorder = tm.SecureStringStrictRecorder()
+        tm.SecureStringStrictRecordContextManager.install(recorder)
+        try:
+            str(SecureString('hello'))
+        finally:
+            tm.SecureStringStrictRecordContextManager.install(None)
+
+        str(SecureString('hello'))
+        assert sum(recorder.sites().values()) == 1
+
+    def test_strict_wins(self):
+        recorder = tm.SecureStringStrictRecorder()
+
+        with tm.SecureStringStrictRecordContextManager(recorder):
+            with tm.SecureStringStrictContextManager(True):
+                with pytest.raises(tm.SecureStringStrictError):
+                    str(SecureString('hello'))
+
+        assert recorder.sites() == {}
+
+    def test_audit(self):
+        events = []
+        listening = [True]  # audit hooks can not be removed, the hook is a no-op after the test
+
+        def hook(event, args):
+            if listening[0] and event == tm.SecureStringStrictRecorder.AUDIT_EVENT:
+                events.append(args)
+
+        sys.addaudithook(hook)
+        recorder = tm.SecureStringStrictRecorder(audit=True)
+        try:
+            with tm.SecureStringStrictRecordContextManager(recorder):
+                str(SecureString('hello'))
+        finally:
+            listening[0] = False
+
+        assert events == [('__str__', __file__, events[0][2])]
+
+    def test_recording_counter(self):
+        recorder = tm.SecureStringStrictRecorder()
+        assert tm._recording == 0
+
+        with tm.SecureStringStrictRecordContextManager(recorder):
+            assert tm._recording == 1
+        assert tm._recording == 0
+
+        tm.SecureStringStrictRecordContextManager.install(recorder)
+        tm.SecureStringStrictRecordContextManager.install(recorder)
+        assert tm._recording == 1
+        str(SecureString('hello'))
+        tm.SecureStringStrictRecordContextManager.install(None)
+        assert tm._recording == 0
+        assert len(recorder.sites()) == 1
+
+    def test_recording_counter_async(self):
+        recorder = tm.SecureStringStrictRecorder()
+
+        async def main():
+            async with tm.SecureStringStrictRecordContextManager(recorder):
+                str(SecureString('hello'))
+                return tm._recording
+
+        assert asyncio.run(main()) == 1
+        assert tm._recording == 0
+        assert len(recorder.sites()) == 1
+
+
+class TestStrictDecorator:
+    def test_strict(self):
+        ss = SecureString('hello')
+
+        @tm.strict
+        def render(value):
+            return str(value)
+
+        with pytest.raises(tm.SecureStringStrictError):
+            render(ss)
+        assert str(ss) == '***'
+        assert tm.SecureStringStrictContextManager.is_strict() is False
+
+    def test_async(self):
+        @tm.strict
+        async def is_strict():
+            await asyncio.sleep(0)
+            return tm.SecureStringStrictContextManager.is_strict()
+
+        assert asyncio.run(is_strict()) is True
+        assert tm.SecureStringStrictContextManager.is_strict() is False
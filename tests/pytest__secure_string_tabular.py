@@ -0,0 +1,96 @@
+import csv
+import io
+import pytest
+import secure_string.secure_string_tabular as tm
+from secure_string import SecureString
+from secure_string.secure_string_mask import SecureStringFingerprintMask
+
+ROWS = [['id', 'login', 'password_hash', 'api_key']] + [[str(i), f'user{i}', f'hash{i}', f'key{i}'] for i in range(100)]
+
+
+@pytest.fixture
+def src(tmp_path):
+    path = tmp_path / 'users.csv'
+    with open(path, 'w', newline='') as f:
+        csv.writer(f).writerows(ROWS)
+    return path
+
+
+def read(path):
+    with open(path, newline='') as f:
+        return list(csv.reader(f))
+
+
+class TestMaskCsv:
+    def test_mask(self, src, tmp_path, monkeypatch):
+        monkeypatch.setattr(tm, 'CHUNK_ROWS', 7)
+        dst = tmp_path / 'masked.csv'
+        assert tm.mask_csv(src, dst, ['password_hash', 'api_key']) == 100
+
+        rows = read(dst)
+        assert rows[0] == ROWS[0]
+        assert rows[1:] == [[i, login, '***', '***'] for i, login, _h, _k in ROWS[1:]]
+
+    def test_workers(self, src, tmp_path):
+        dst = tmp_path / 'masked.csv'
+        mask = SecureStringFingerprintMask(key='key')
+        assert tm.mask_csv(str(src), str(dst), ['api_key'], mask=mask, workers=3) == 100
+
+        rows = read(dst)
+        assert rows[0] == ROWS[0]
+        assert rows[1:] == [[i, login, h, mask(k)] for i, login, h, k in ROWS[1:]]
+        assert sorted(p.name for p in tmp_path.iterdir()) == ['masked.csv', 'users.csv']  # no part files
+
+    def test_workers_default_fingerprint_key(self, tmp_path, monkeypatch):
+        """workers use the key of the parent process, the same values have the same fingerprints"""
+        from secure_string import secure_string_fingerprint
+        monkeypatch.delenv(secure_string_fingerprint.FINGERPRINT_KEY_ENV, raising=False)
+        monkeypatch.setattr(secure_string_fingerprint, '_process_key', None)
+
+        src = tmp_path / 'repeated.csv'
+        with open(src, 'w', newline='') as f:
+            csv.writer(f).writerows([['id', 'api_key']] + [[str(i), 'same key'] for i in range(300)])
+        dst = tmp_path / 'masked.csv'
+        mask = SecureStringFingerprintMask()
+        assert tm.mask_csv(src, dst, ['api_key'], mask=mask, workers=3) == 300
+
+        assert {row[1] for row in read(dst)[1:]} == {mask('same key')}
+
+    def test_workers_empty(self, tmp_path):
+        src = tmp_path / 'empty.tsv'
+        src.write_text('id\tapi_key\n')
+        dst = tmp_path / 'masked.tsv'
+        assert tm.mask_csv(src, dst, ['api_key'], delimiter='\t', workers=2) == 0
+        assert dst.read_bytes() == b'id\tapi_key\r\n'
+
+    def test_workers_unpicklable_mask(self, src, tmp_path):
+        dst = tmp_path / 'masked.csv'
+        with pytest.raises(TypeError, match='picklable'):
+            tm.mask_csv(src, dst, ['api_key'], mask=lambda value: '***', workers=2)
+        assert not dst.exists()
+
+        assert tm.mask_csv(src, dst, ['api_key'], mask=lambda value: '***', workers=1) == 100
+
+    def test_split(self, src):
+        start = len('id,login,password_hash,api_key\r\n')
+        ranges = tm._split(str(src), start, 4)
+        assert ranges[0][0] == start
+        assert ranges[-1][1] == src.stat().st_size
+        assert all(end == begin for (_s, end), (begin, _e) in zip(ranges, ranges[1:]))
+        data = src.read_bytes()
+        assert all(data[begin - 1:begin] == b'\n' for begin, _end in ranges)
+
+    def test_unknown_column(self, src, tmp_path):
+        with pytest.raises(ValueError):
+            tm.mask_csv(src, tmp_path / 'masked.csv', ['token'])
+
+
+class TestIterSecureRows:
+    def test_rows(self):
+        file = io.StringIO('login\tpassword\nbob\tmy password\nshort\n')
+        header, bob, short = tm.iter_secure_rows(file, ['password'], delimiter='\t')
+        assert header == ['login', 'password']
+        assert bob[0] == 'bob'
+        assert isinstance(bob[1], SecureString)
+        assert bob[1].value == 'my password'
+        assert short == ['short']